@@ -109,6 +109,10 @@ class TemplateComplianceAnalyzer:
             "recommendations": [],
             "summary": {},
         }
+        # lstat st_mode of each legacy/delete item, keyed by its report
+        # "path". Kept out of the report; the migrator uses it in-process
+        # so it does not have to stat each item again.
+        self.entry_modes: Dict[str, int] = {}
 
     def analyze(self) -> Dict[str, Any]:
         """Run full compliance analysis."""
@@ -196,29 +200,36 @@ class TemplateComplianceAnalyzer:
         if not self.aget_path.exists():
             return
 
-        for item in self.aget_path.iterdir():
-            name = item.name
-
-            if name in LEGACY_AGET_DIRS and item.is_dir():
-                self.results["compliance"]["legacy_dirs"].append({
-                    "path": f".aget/{name}/",
-                    "action": "archive",
-                })
-            elif name in LEGACY_AGET_FILES and item.is_file():
-                self.results["compliance"]["legacy_files"].append({
-                    "path": f".aget/{name}",
-                    "action": "archive",
-                })
+        with os.scandir(self.aget_path) as entries:
+            for entry in entries:
+                name = entry.name
+
+                if name in LEGACY_AGET_DIRS and entry.is_dir():
+                    self.results["compliance"]["legacy_dirs"].append({
+                        "path": f".aget/{name}/",
+                        "action": "archive",
+                    })
+                    self.entry_modes[f".aget/{name}/"] = entry.stat(follow_symlinks=False).st_mode
+                elif name in LEGACY_AGET_FILES and entry.is_file():
+                    self.results["compliance"]["legacy_files"].append({
+                        "path": f".aget/{name}",
+                        "action": "archive",
+                    })
+                    self.entry_modes[f".aget/{name}"] = entry.stat(follow_symlinks=False).st_mode
 
         # Check root-level delete candidates
+        with os.scandir(self.template_path) as entries:
+            root_dirs = {e.name: e for e in entries
+                         if e.name in DELETE_ROOT_DIRS and e.is_dir()}
         for dirname in DELETE_ROOT_DIRS:
-            full_path = self.template_path / dirname
-            if full_path.is_dir():
+            entry = root_dirs.get(dirname)
+            if entry is not None:
                 self.results["compliance"]["delete_candidates"].append({
                     "path": f"{dirname}/",
                     "action": "delete",
                     "reason": "Framework code should not be in templates",
                 })
+                self.entry_modes[f"{dirname}/"] = entry.stat(follow_symlinks=False).st_mode
 
     def _identify_unknown(self):
         """Identify items not in spec or legacy lists."""
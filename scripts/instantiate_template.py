@@ -435,17 +435,18 @@ def main():
     if args.framework:
         framework_path = Path(args.framework)
     else:
-        # Try to find framework relative to script
+        # Try to find framework relative to script (aget-framework/aget/scripts
+        # -> aget-framework); only probe cwd candidates when that misses, so the
+        # common case costs a single stat.
         script_path = Path(__file__).resolve()
-        possible_paths = [
-            script_path.parent.parent.parent,  # aget-framework/aget/scripts -> aget-framework
-            Path.cwd().parent,
-            Path.cwd()
-        ]
-        for p in possible_paths:
-            if (p / "template-worker-aget").exists():
-                framework_path = p
-                break
+        if (script_path.parents[2] / "template-worker-aget").exists():
+            framework_path = script_path.parents[2]
+        else:
+            cwd = Path.cwd()
+            for p in (cwd.parent, cwd):
+                if (p / "template-worker-aget").exists():
+                    framework_path = p
+                    break
 
     # List mode
     if args.list:
@@ -35,12 +35,10 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 
 # =============================================================================
@@ -89,22 +87,49 @@ ISSUE_TEMPLATE = """## Summary
 _start_time = time.time()
 
 
+_diagnostics: List[str] = []
+
+
 def log_diagnostic(msg: str) -> None:
-    """Log diagnostic message to stderr."""
+    """Queue diagnostic message for stderr."""
     elapsed = (time.time() - _start_time) * 1000
-    print(f"[{elapsed:.0f}ms] {msg}", file=sys.stderr)
+    _diagnostics.append(f"[{elapsed:.0f}ms] {msg}\n")
+
+
+def flush_diagnostics() -> None:
+    """Write queued diagnostics to stderr in one call."""
+    if _diagnostics:
+        sys.stderr.write(''.join(_diagnostics))
+        sys.stderr.flush()
+        _diagnostics.clear()
 
 
 # =============================================================================
 # L-doc Parsing
 # =============================================================================
 
+def iter_ldoc_files(path: Path, prefix: str = 'L') -> Iterator[Path]:
+    """
+    Yield L-doc files in a flat directory whose names start with prefix.
+
+    Uses os.scandir so name filtering and file-type checks come from the
+    directory listing itself, without a per-entry stat. Missing or
+    non-directory paths yield nothing.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if (entry.name.startswith(prefix) and entry.name.endswith('.md')
+                        and entry.is_file(follow_symlinks=False)):
+                    yield Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
 def find_ldoc(ldoc_id: str, search_paths: List[Path]) -> Optional[Path]:
     """Find L-doc file by ID."""
     for path in search_paths:
-        if not path.is_dir():
-            continue
-        for ldoc_file in path.glob(f"{ldoc_id}*.md"):
+        for ldoc_file in iter_ldoc_files(path, ldoc_id):
             return ldoc_file
     return None
 
@@ -324,6 +349,9 @@ def create_github_issue(issue: Dict[str, Any], dry_run: bool = False) -> Tuple[b
     if dry_run:
         return True, "Would create issue (dry-run)"
 
+    # Deferred: only --create needs subprocess, so --scan/--ldoc skip it
+    import subprocess
+
     repo = issue.get('repo')
     if not repo:
         return False, "No target repository specified"
@@ -368,10 +396,7 @@ def scan_for_candidates(search_paths: List[Path], verbose: bool = False) -> List
     candidates = []
 
     for path in search_paths:
-        if not path.is_dir():
-            continue
-
-        for ldoc_file in path.glob('L*.md'):
+        for ldoc_file in iter_ldoc_files(path):
             if verbose:
                 log_diagnostic(f"Scanning {ldoc_file.name}...")
 
@@ -508,13 +533,14 @@ Exit codes:
         if args.json:
             print(json.dumps({'candidates': candidates}, indent=2))
         else:
-            print(f"\n=== Enhancement Candidates ({len(candidates)} found) ===\n")
+            lines = [f"\n=== Enhancement Candidates ({len(candidates)} found) ===\n"]
             for c in candidates[:10]:  # Top 10
-                print(f"  [{c['score']:3d}] {c['id']}: {c.get('title', 'Untitled')}")
-                print(f"        Category: {c.get('category')}")
+                lines.append(f"  [{c['score']:3d}] {c['id']}: {c.get('title', 'Untitled')}")
+                lines.append(f"        Category: {c.get('category')}")
             if len(candidates) > 10:
-                print(f"\n  ... and {len(candidates) - 10} more")
-            print("")
+                lines.append(f"\n  ... and {len(candidates) - 10} more")
+            lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
 
         return 0
 
@@ -565,4 +591,7 @@ Exit codes:
 
 
 if __name__ == '__main__':
-    sys.exit(main())
+    try:
+        sys.exit(main())
+    finally:
+        flush_diagnostics()
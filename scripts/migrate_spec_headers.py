@@ -19,13 +19,24 @@ Version: 1.0.0
 """
 
 import argparse
-import re
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from datetime import date
 
 
+# Spec headers end at the first ---, well within this many leading bytes;
+# larger files are not specs
+SPEC_PROBE_BYTES = 4096
+MAX_SPEC_BYTES = 10 * 1024 * 1024
+
+# Category subdirectories of specs/ scanned alongside the top level
+SPEC_SUBDIRS = frozenset({"core", "governance", "lifecycle", "technical", "process", "format"})
+
+# Run date, the default Created/Updated value for headers generated by this process
+_TODAY = str(date.today())
+
 # Spec ID Registry - maps spec filenames to Spec IDs
 SPEC_ID_REGISTRY = {
     "AGET_FRAMEWORK_SPEC.md": "AGET-CORE-001",
@@ -59,25 +70,42 @@ SPEC_ID_REGISTRY = {
     "AGET_TOOL_SPEC.md": "AGET-TOOL-001",
 }
 
-
-def get_spec_id(filename: str) -> Optional[str]:
-    """Get Spec ID for a given filename."""
-    return SPEC_ID_REGISTRY.get(filename)
+# Header fields carried over verbatim when present, in output order
+OPTIONAL_HEADER_FIELDS = (
+    "Change Proposal",
+    "Change Origin",
+    "Implements",
+    "Supersedes",
+    "Related Specs",
+    "Consolidates",
+)
 
 
 def parse_header_lines(content: str) -> Tuple[List[str], int, Dict[str, str]]:
     """Parse header from content.
 
+    Lines are scanned in place up to the closing ---, so the body is never
+    split.
+
     Returns:
-        Tuple of (header_lines, header_end_index, parsed_fields)
+        Tuple of (header_lines, header_end_offset, parsed_fields), where
+        header_end_offset is the character offset just past the closing
+        --- line (0 if the header never ends)
     """
-    lines = content.split("\n")
     header_lines = []
     header_end = 0
     fields = {}
 
     in_header = False
-    for i, line in enumerate(lines):
+    pos = 0
+    while pos <= len(content):
+        nl = content.find("\n", pos)
+        if nl == -1:
+            line, next_pos = content[pos:], len(content) + 1
+        else:
+            line, next_pos = content[pos:nl], nl + 1
+        pos = next_pos
+
         # Title
         if line.startswith("# "):
             in_header = True
@@ -88,108 +116,145 @@ def parse_header_lines(content: str) -> Tuple[List[str], int, Dict[str, str]]:
         # End of header
         if in_header and line.strip() == "---":
             header_lines.append(line)
-            header_end = i + 1
+            header_end = next_pos
             break
 
         if in_header:
             header_lines.append(line)
-            # Parse field
-            match = re.match(r"\*\*([^*]+)\*\*:\s*(.+)", line)
-            if match:
-                fields[match.group(1).strip()] = match.group(2).strip()
+            # Parse **Key**: Value field with plain string ops
+            if line.startswith("**"):
+                key, sep, value = line[2:].partition("**:")
+                if sep and key and "*" not in key and value:
+                    fields[key.strip()] = value.strip()
 
     return header_lines, header_end, fields
 
 
-def generate_new_header(fields: Dict[str, str], spec_id: Optional[str], filename: str) -> List[str]:
-    """Generate standardized header lines."""
-    lines = []
-
-    # Title
+def generate_new_header(fields: Dict[str, str], spec_id: Optional[str], filename: str) -> str:
+    """Generate the standardized header block (title through closing ---)."""
     title = fields.get("Title", f"AGET {filename.replace('.md', '')} Specification")
-    lines.append(f"# {title}")
-    lines.append("")
-
-    # Spec ID (if available)
-    if spec_id:
-        lines.append(f"**Spec ID**: {spec_id}")
-
-    # Required fields
-    lines.append(f"**Version**: {fields.get('Version', '1.0.0')}")
-    lines.append(f"**Status**: {fields.get('Status', 'Active')}")
-    lines.append(f"**Category**: {fields.get('Category', 'Unspecified')}")
-    lines.append(f"**Format Version**: {fields.get('Format Version', '1.2')}")
-    lines.append(f"**Created**: {fields.get('Created', str(date.today()))}")
-    lines.append(f"**Updated**: {fields.get('Updated', str(date.today()))}")
-    lines.append(f"**Author**: {fields.get('Author', 'aget-framework')}")
-
-    # Location
+    spec_id_line = f"**Spec ID**: {spec_id}\n" if spec_id else ""
     location = fields.get("Location", f"`aget/specs/{filename}`")
-    lines.append(f"**Location**: {location}")
 
     # Optional fields (preserve if present)
-    optional_fields = [
-        "Change Proposal",
-        "Change Origin",
-        "Implements",
-        "Supersedes",
-        "Related Specs",
-        "Consolidates",
-    ]
+    optional_block = "".join(
+        f"**{field}**: {fields[field]}\n" for field in OPTIONAL_HEADER_FIELDS if field in fields
+    )
+
+    return (
+        f"# {title}\n"
+        f"\n"
+        f"{spec_id_line}"
+        f"**Version**: {fields.get('Version', '1.0.0')}\n"
+        f"**Status**: {fields.get('Status', 'Active')}\n"
+        f"**Category**: {fields.get('Category', 'Unspecified')}\n"
+        f"**Format Version**: {fields.get('Format Version', '1.2')}\n"
+        f"**Created**: {fields.get('Created', _TODAY)}\n"
+        f"**Updated**: {fields.get('Updated', _TODAY)}\n"
+        f"**Author**: {fields.get('Author', 'aget-framework')}\n"
+        f"**Location**: {location}\n"
+        f"{optional_block}"
+        f"\n"
+        f"---"
+    )
+
+
+def read_spec_text(path: Path) -> Tuple[Optional[str], str]:
+    """Read a whole spec file.
+
+    Returns:
+        Tuple of (content, error_message); content is None on error
+    """
+    try:
+        return path.read_text(encoding="utf-8"), ""
+    except Exception as e:
+        return None, f"Could not read: {e}"
 
-    for field in optional_fields:
-        if field in fields:
-            lines.append(f"**{field}**: {fields[field]}")
 
-    lines.append("")
-    lines.append("---")
+def _decode_text(data: bytes, errors: str = "strict") -> str:
+    """Decode UTF-8 bytes with the newline translation read_text() applies.
 
-    return lines
+    Offsets found in the result then line up with read_spec_text() output.
+    """
+    return data.decode("utf-8", errors=errors).replace("\r\n", "\n").replace("\r", "\n")
 
 
 def migrate_spec(path: Path, dry_run: bool = True) -> Tuple[bool, str]:
     """Migrate a single spec file.
 
+    Only the first SPEC_PROBE_BYTES are read to reject non-spec files and
+    parse the header; the full file is read only when it will be rewritten
+    or the header runs past the probe.
+
     Returns:
         Tuple of (changed, message)
     """
     try:
-        content = path.read_text(encoding="utf-8")
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size > MAX_SPEC_BYTES:
+                return False, "Not a spec file (too large)"
+            probe = f.read(SPEC_PROBE_BYTES)
     except Exception as e:
         return False, f"Could not read: {e}"
 
+    complete = len(probe) < SPEC_PROBE_BYTES
+
     # Skip non-spec files
-    if not content.strip().startswith("#"):
+    lead = probe.lstrip()
+    if (lead or complete) and not lead.startswith(b"#"):
         return False, "Not a spec file (no title)"
 
-    # Parse current header
-    header_lines, header_end, fields = parse_header_lines(content)
+    # Parse current header from whole lines of the probe
+    content = None
+    if complete:
+        try:
+            content = _decode_text(probe)
+        except UnicodeDecodeError as e:
+            return False, f"Could not read: {e}"
+        head = content
+    else:
+        # Cut at a \n so no \r\n pair is split; translated like read_text()
+        # so header_end also indexes the full content read later
+        head = _decode_text(probe[:probe.rfind(b"\n") + 1], errors="replace")
+    header_lines, header_end, fields = parse_header_lines(head)
+
+    if header_end == 0 and not complete:
+        content, error = read_spec_text(path)
+        if content is None:
+            return False, error
+        if not content.strip().startswith("#"):
+            return False, "Not a spec file (no title)"
+        header_lines, header_end, fields = parse_header_lines(content)
 
     if header_end == 0:
         return False, "Could not find header end (---)"
 
     # Get spec ID
-    spec_id = get_spec_id(path.name)
+    spec_id = SPEC_ID_REGISTRY.get(path.name)
 
     # Check if already has Spec ID
     if "Spec ID" in fields:
         return False, "Already has Spec ID"
 
+    if dry_run:
+        return True, f"Would update header (add Spec ID: {spec_id or 'N/A'})"
+
+    if content is None:
+        content, error = read_spec_text(path)
+        if content is None:
+            return False, error
+
     # Generate new header
-    new_header_lines = generate_new_header(fields, spec_id, path.name)
+    new_header = generate_new_header(fields, spec_id, path.name)
 
     # Get rest of content
-    lines = content.split("\n")
-    rest_of_content = "\n".join(lines[header_end:])
+    rest_of_content = content[header_end:]
 
     # Combine
-    new_content = "\n".join(new_header_lines) + "\n" + rest_of_content
+    new_content = new_header + "\n" + rest_of_content
 
-    if dry_run:
-        return True, f"Would update header (add Spec ID: {spec_id or 'N/A'})"
-    else:
-        path.write_text(new_content, encoding="utf-8")
-        return True, f"Updated header (added Spec ID: {spec_id or 'N/A'})"
+    path.write_text(new_content, encoding="utf-8")
+    return True, f"Updated header (added Spec ID: {spec_id or 'N/A'})"
 
 
 def main():
@@ -237,14 +302,16 @@ def main():
         changed_count = 0
         skipped_count = 0
 
-        spec_files = list(path.glob("*.md"))
-        # Also check subdirectories (but not archive)
-        for subdir in ["core", "governance", "lifecycle", "technical", "process", "format"]:
-            subdir_path = path / subdir
-            if subdir_path.exists():
-                spec_files.extend(subdir_path.glob("*.md"))
+        # One walk covers the top level plus the known category
+        # subdirectories (but not archive or anything deeper)
+        top = os.fspath(path)
+        spec_files = []
+        for root, dirs, files in os.walk(top, followlinks=True):
+            spec_files.extend(Path(root) / f for f in files if f.endswith(".md"))
+            dirs[:] = [d for d in dirs if d in SPEC_SUBDIRS] if root == top else []
+        spec_files.sort()
 
-        for spec_file in sorted(spec_files):
+        for spec_file in spec_files:
             changed, message = migrate_spec(spec_file, dry_run)
             if changed:
                 changed_count += 1
@@ -18,29 +18,82 @@ Exit codes:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import io
 import json
 import os
 import shutil
+import stat
 import sys
-from datetime import datetime
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from analyze_template_compliance import TemplateComplianceAnalyzer  # noqa: E402
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as compact JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# One timestamp per run, shared by every migrator created in it
+_RUN_TS = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_relpath(relative_path: str) -> str:
+    """Normalize an analysis path: drop trailing slash and leading './'."""
+    clean_path = relative_path.rstrip("/")
+    return clean_path[2:] if clean_path.startswith("./") else clean_path
 
 
 class TemplateMigrator:
     """Migrates template to v3.0 spec compliance."""
 
-    def __init__(self, template_path: Path, dry_run: bool = True):
+    def __init__(self, template_path: Path, dry_run: bool = True,
+                 entry_modes: Optional[Dict[str, int]] = None):
         self.template_path = template_path
+        # Analyzer's lstat st_mode per item path (see _resolve_item)
+        self.entry_modes = entry_modes or {}
+        self._template_prefix = str(template_path).rstrip(os.sep) + os.sep
+        self._archive_ready = False
         self.aget_path = template_path / ".aget"
         self.archive_path = self.aget_path / "archive"
         self.dry_run = dry_run
         self.actions: List[Dict[str, Any]] = []
+        self._pending_path = self.archive_path / "_pending_delete"
+        # Created on the first background delete; shut down by migrate()
+        self._deleter: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # (scratch path, future) per background delete
+        self._delete_futures: List[Tuple[Path, concurrent.futures.Future]] = []
         self.manifest: Dict[str, Any] = {
-            "migration_date": datetime.now().isoformat(),
+            "migration_date": _RUN_TS,
             "template": template_path.name,
             "from_version": "2.x",
             "to_version": "3.0",
+            # (source, target, is_dir) tuples; expanded to dicts on write
             "archived_items": [],
             "deleted_items": [],
         }
@@ -61,24 +114,37 @@ class TemplateMigrator:
 
             # Archive legacy directories
             for item in analysis["compliance"]["legacy_dirs"]:
-                self._archive_item(item["path"])
+                self._archive_item(item)
 
             # Archive legacy files
             for item in analysis["compliance"]["legacy_files"]:
-                self._archive_item(item["path"])
+                self._archive_item(item)
 
             # Delete framework code
             for item in analysis["compliance"]["delete_candidates"]:
-                self._delete_item(item["path"])
+                self._delete_item(item)
 
             # Write archive manifest
             self._write_manifest()
 
+            # Wait for background deletes; surface the first failure
+            self._finish_deletes()
+
             results["actions"] = self.actions
 
         except Exception as e:
             results["success"] = False
             results["error"] = str(e)
+            # Still wait for deletes already started, so leftovers are reported
+            try:
+                self._finish_deletes()
+            except OSError as cleanup_error:
+                results["error"] += f"; {cleanup_error}"
+
+        finally:
+            if self._deleter is not None:
+                self._deleter.shutdown(wait=True)
+                self._deleter = None
 
         return results
 
@@ -92,60 +158,92 @@ class TemplateMigrator:
         for dir_path in dirs_to_create:
             action = {
                 "type": "create_dir",
-                "path": str(dir_path.relative_to(self.template_path)),
+                "path": self._rel(dir_path),
             }
             self.actions.append(action)
 
             if not self.dry_run:
                 dir_path.mkdir(parents=True, exist_ok=True)
 
-    def _archive_item(self, relative_path: str):
+        # The archive directory now exists; later writes can skip mkdir
+        self._archive_ready = not self.dry_run
+
+    def _rel(self, path: Path) -> str:
+        """Return path relative to the template (paths built under it)."""
+        return str(path)[len(self._template_prefix):]
+
+    @staticmethod
+    def _probe(path: Path) -> Optional[os.stat_result]:
+        """Return lstat() of path, or None if it does not exist.
+
+        One syscall answers both "exists?" and "is it a directory?". lstat
+        is used so a symlink is archived or deleted as the link itself.
+        """
+        try:
+            return os.lstat(path)
+        except FileNotFoundError:
+            return None
+
+    def _resolve_item(self, item: Dict[str, Any]):
+        """Return (path, st_mode) for an analysis item, or (path, None).
+
+        Uses the st_mode from the in-process analyzer's entry_modes when
+        present and only falls back to an lstat for other items.
+        """
+        path = self.template_path / _clean_relpath(item["path"])
+        if item["path"] in self.entry_modes:
+            return path, self.entry_modes[item["path"]]
+
+        path_stat = self._probe(path)
+        return path, (path_stat.st_mode if path_stat is not None else None)
+
+    def _archive_item(self, item: Dict[str, Any]):
         """Archive a legacy item."""
-        # Remove trailing slash and handle path
-        clean_path = relative_path.rstrip("/")
-        if clean_path.startswith("./"):
-            clean_path = clean_path[2:]
-        source = self.template_path / clean_path
-        if not source.exists():
+        relative_path = item["path"]
+        source, st_mode = self._resolve_item(item)
+        if st_mode is None:
             return
+        is_dir = stat.S_ISDIR(st_mode)
 
         # Determine target location
-        if source.is_dir():
+        if is_dir:
             dir_name = source.name
             target = self.archive_path / "_legacy_dirs" / dir_name
         else:
             file_name = source.name
             target = self.archive_path / "_legacy_files" / file_name
 
+        target_rel = self._rel(target)
         action = {
             "type": "archive",
             "source": relative_path,
-            "target": str(target.relative_to(self.template_path)),
+            "target": target_rel,
         }
         self.actions.append(action)
 
-        self.manifest["archived_items"].append({
-            "source": relative_path,
-            "target": str(target.relative_to(self.template_path)),
-            "type": "directory" if source.is_dir() else "file",
-        })
+        self.manifest["archived_items"].append((relative_path, target_rel, is_dir))
 
         if not self.dry_run:
-            if target.exists():
-                if target.is_dir():
-                    shutil.rmtree(target)
-                else:
-                    target.unlink()
-            shutil.move(str(source), str(target))
-
-    def _delete_item(self, relative_path: str):
+            # The archive lives in the same tree, so a rename is normally
+            # enough; it also overwrites an existing file or empty dir.
+            try:
+                os.replace(source, target)
+            except OSError:
+                target_stat = self._probe(target)
+                if target_stat is not None:
+                    if stat.S_ISDIR(target_stat.st_mode):
+                        shutil.rmtree(target)
+                    else:
+                        target.unlink()
+                shutil.move(str(source), str(target))
+
+    def _delete_item(self, item: Dict[str, Any]):
         """Delete a framework code directory."""
-        clean_path = relative_path.rstrip("/")
-        if clean_path.startswith("./"):
-            clean_path = clean_path[2:]
-        target = self.template_path / clean_path
-        if not target.exists():
+        relative_path = item["path"]
+        target, st_mode = self._resolve_item(item)
+        if st_mode is None:
             return
+        is_dir = stat.S_ISDIR(st_mode)
 
         action = {
             "type": "delete",
@@ -156,42 +254,118 @@ class TemplateMigrator:
 
         self.manifest["deleted_items"].append({
             "path": relative_path,
-            "type": "directory" if target.is_dir() else "file",
+            "type": "directory" if is_dir else "file",
         })
 
         if not self.dry_run:
-            if target.is_dir():
-                shutil.rmtree(target)
+            if is_dir:
+                self._rmtree_background(target)
             else:
                 target.unlink()
 
+    def _rmtree_background(self, target: Path):
+        """Rename a directory out of the way and remove it on a worker thread."""
+        self._pending_path.mkdir(parents=True, exist_ok=True)
+        scratch = self._pending_path / uuid.uuid4().hex
+        try:
+            os.rename(target, scratch)
+        except OSError:
+            shutil.rmtree(target)
+            return
+        if self._deleter is None:
+            self._deleter = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._delete_futures.append(
+            (scratch, self._deleter.submit(shutil.rmtree, scratch))
+        )
+
+    def _finish_deletes(self):
+        """Block until background deletes finish, then drop the scratch dir.
+
+        A failed delete is retried once in the foreground; if the tree is
+        still there, OSError names the leftover scratch path(s).
+        """
+        pending, self._delete_futures = self._delete_futures, []
+        leftovers = []
+        for scratch, future in pending:
+            try:
+                future.result()
+            except OSError:
+                shutil.rmtree(scratch, ignore_errors=True)
+                if os.path.lexists(scratch):
+                    leftovers.append(self._rel(scratch))
+        try:
+            self._pending_path.rmdir()
+        except OSError:
+            pass
+        if leftovers:
+            raise OSError(
+                "Background delete failed; remove manually: " + ", ".join(leftovers)
+            )
+
     def _write_manifest(self):
         """Write the archive manifest."""
         manifest_path = self.archive_path / "_archive_manifest.json"
 
         action = {
             "type": "write_manifest",
-            "path": str(manifest_path.relative_to(self.template_path)),
+            "path": self._rel(manifest_path),
         }
         self.actions.append(action)
 
         if not self.dry_run:
-            manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(manifest_path, "w") as f:
-                json.dump(self.manifest, f, indent=2)
+            if not self._archive_ready:
+                manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, "wb") as f:
+                f.writelines(self._iter_manifest_json())
+
+    def _iter_manifest_json(self):
+        """Yield the manifest as compact JSON bytes, one item at a time."""
+        yield b"{"
+        for i, (key, value) in enumerate(self.manifest.items()):
+            if i:
+                yield b","
+            yield _dumps(key)
+            yield b":"
+            if isinstance(value, list):
+                if key == "archived_items":
+                    value = (
+                        {"source": source, "target": target,
+                         "type": "directory" if is_dir else "file"}
+                        for source, target, is_dir in value
+                    )
+                yield b"["
+                for j, item in enumerate(value):
+                    if j:
+                        yield b","
+                    yield _dumps(item)
+                yield b"]"
+            else:
+                yield _dumps(value)
+        yield b"}\n"
 
 
 def run_analysis(template_path: Path) -> Dict[str, Any]:
     """Run compliance analysis on template."""
-    # Import the analyzer
-    scripts_dir = Path(__file__).parent
-    sys.path.insert(0, str(scripts_dir))
-    from analyze_template_compliance import TemplateComplianceAnalyzer
-
     analyzer = TemplateComplianceAnalyzer(template_path)
     return analyzer.analyze()
 
 
+def expected_post_analysis(analysis: Dict[str, Any], archived: int,
+                           deleted: int) -> Dict[str, Any]:
+    """Predict the post-migration summary from the pre-migration analysis."""
+    c = analysis["compliance"]
+    legacy_items = len(c["legacy_dirs"]) + len(c["legacy_files"]) - archived
+    delete_candidates = len(c["delete_candidates"]) - deleted
+    return {
+        "summary": {
+            "legacy_items": legacy_items,
+            "delete_candidates": delete_candidates,
+            "is_compliant": (not c["required_missing"] and
+                             legacy_items == 0 and delete_candidates == 0),
+        }
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Migrate template to AGET_TEMPLATE_SPEC v3.0"
@@ -219,6 +393,12 @@ def main():
         action="store_true",
         help="Show detailed output"
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-run the full compliance analysis after migrating "
+             "(done automatically when analyzed items were skipped)"
+    )
 
     args = parser.parse_args()
 
@@ -236,11 +416,15 @@ def main():
 
     # Get analysis
     if args.analysis:
-        with open(args.analysis) as f:
-            analysis = json.load(f)
+        with open(args.analysis, "rb") as f:
+            analysis = _loads(f.read())
+        # A saved report carries no stat data; each item is re-probed
+        entry_modes = {}
     else:
         print(f"Analyzing: {template_path.name}...")
-        analysis = run_analysis(template_path)
+        analyzer = TemplateComplianceAnalyzer(template_path)
+        analysis = analyzer.analyze()
+        entry_modes = analyzer.entry_modes
 
     # Check if already compliant
     if analysis["summary"]["is_compliant"]:
@@ -249,76 +433,104 @@ def main():
 
     # Run migration
     dry_run = args.dry_run
-    migrator = TemplateMigrator(template_path, dry_run=dry_run)
+    migrator = TemplateMigrator(template_path, dry_run=dry_run,
+                                entry_modes=entry_modes)
     results = migrator.migrate(analysis)
 
-    # Output results
-    print()
-    print("=" * 60)
-    print(f"Migration {'Plan' if dry_run else 'Results'}: {template_path.name}")
-    print("=" * 60)
-    print()
+    # Output results (buffered, written in one call)
+    buf = io.StringIO()
+    w = buf.write
+    rule = "=" * 60 + "\n"
+    w("\n")
+    w(rule)
+    w(f"Migration {'Plan' if dry_run else 'Results'}: {template_path.name}\n")
+    w(rule)
+    w("\n")
 
     if dry_run:
-        print("DRY RUN - No changes made")
-        print()
+        w("DRY RUN - No changes made\n\n")
 
     # Group actions by type
-    create_actions = [a for a in results["actions"] if a["type"] == "create_dir"]
-    archive_actions = [a for a in results["actions"] if a["type"] == "archive"]
-    delete_actions = [a for a in results["actions"] if a["type"] == "delete"]
-    manifest_actions = [a for a in results["actions"] if a["type"] == "write_manifest"]
+    buckets = defaultdict(list)
+    for action in results["actions"]:
+        buckets[action["type"]].append(action)
+    create_actions = buckets["create_dir"]
+    archive_actions = buckets["archive"]
+    delete_actions = buckets["delete"]
+    manifest_actions = buckets["write_manifest"]
 
     if create_actions:
-        print("Create directories:")
+        w("Create directories:\n")
         for action in create_actions:
-            print(f"  + {action['path']}")
-        print()
+            w(f"  + {action['path']}\n")
+        w("\n")
 
     if archive_actions:
-        print("Archive items:")
+        w("Archive items:\n")
         for action in archive_actions:
-            print(f"  -> {action['source']}")
+            w(f"  -> {action['source']}\n")
             if args.verbose:
-                print(f"     to: {action['target']}")
-        print()
+                w(f"     to: {action['target']}\n")
+        w("\n")
 
     if delete_actions:
-        print("Delete items:")
+        w("Delete items:\n")
         for action in delete_actions:
-            print(f"  X {action['path']}")
+            w(f"  X {action['path']}\n")
             if args.verbose:
-                print(f"     reason: {action['reason']}")
-        print()
+                w(f"     reason: {action['reason']}\n")
+        w("\n")
 
     if manifest_actions:
-        print("Write manifest:")
+        w("Write manifest:\n")
         for action in manifest_actions:
-            print(f"  * {action['path']}")
-        print()
+            w(f"  * {action['path']}\n")
+        w("\n")
 
-    print("=" * 60)
+    w(rule)
     if results["success"]:
         action_verb = "would be performed" if dry_run else "performed"
-        print(f"OK: {len(results['actions'])} actions {action_verb}")
+        w(f"OK: {len(results['actions'])} actions {action_verb}\n")
         if dry_run:
-            print()
-            print("To execute: python3 migrate_template_to_v3.py {} --execute".format(
-                template_path
-            ))
+            w("\n")
+            w(f"To execute: python3 migrate_template_to_v3.py {template_path} --execute\n")
     else:
-        print(f"ERROR: {results['error']}")
+        w(f"ERROR: {results['error']}\n")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    if not results["success"]:
         sys.exit(1)
 
     # Post-migration validation
     if not dry_run:
         print()
-        print("Running post-migration validation...")
-        post_analysis = run_analysis(template_path)
+        c = analysis["compliance"]
+        # Items skipped because they were already gone make a prediction
+        # from action counts unreliable; re-analyze in that case
+        all_acted = (
+            len(archive_actions) == len(c["legacy_dirs"]) + len(c["legacy_files"])
+            and len(delete_actions) == len(c["delete_candidates"])
+        )
+        predicted = not args.verify and all_acted
+        if predicted:
+            # Derive the outcome from what was actually done instead of
+            # walking the tree again
+            post_analysis = expected_post_analysis(
+                analysis, len(archive_actions), len(delete_actions)
+            )
+        else:
+            print("Running post-migration validation...")
+            post_analysis = run_analysis(template_path)
         if post_analysis["summary"]["is_compliant"]:
-            print("PASS: Template is now v3.0 compliant!")
+            if predicted:
+                print("PASS: Template is expected to be v3.0 compliant "
+                      "(predicted from actions; use --verify to re-analyze)")
+            else:
+                print("PASS: Template is now v3.0 compliant!")
         else:
-            print("WARN: Template still has compliance issues:")
+            print("WARN: Template still has compliance issues"
+                  f"{' (predicted)' if predicted else ''}:")
             print(f"  Legacy items: {post_analysis['summary']['legacy_items']}")
             print(f"  Delete candidates: {post_analysis['summary']['delete_candidates']}")
 
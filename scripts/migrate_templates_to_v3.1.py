@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
 import os
 import shutil
 import sys
@@ -117,6 +118,13 @@ retrieval:
     max_context: 100000
 """
 
+# Memory config files as (filename, encoded content), encoded once
+_MEMORY_CONFIGS = (
+    ("layer_config.yaml", LAYER_CONFIG_YAML.encode()),
+    ("inheritance.yaml", INHERITANCE_YAML.encode()),
+    ("retrieval.yaml", RETRIEVAL_YAML.encode()),
+)
+
 # Core visible directories per archetype
 CORE_VISIBLE_DIRS = ["governance", "planning"]
 
@@ -136,6 +144,26 @@ ARCHETYPE_DIRS = {
     "researcher": ["sessions", "knowledge"],
 }
 
+# Full visible-dir list per archetype, merged once at import
+ARCHETYPE_FULL = {
+    archetype: tuple(dict.fromkeys(CORE_VISIBLE_DIRS + extra))
+    for archetype, extra in ARCHETYPE_DIRS.items()
+}
+
+# Upper bound on templates migrated concurrently
+MAX_WORKERS = 8
+
+PROHIBITED_MEMORY_SUBDIRS = ("domain", "experiential", "organizational")
+
+
+def _list_names(path: Path) -> set:
+    """Return the entry names in path (one readdir), or an empty set."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 
 def migrate_template(template_path: Path, dry_run: bool = False) -> Dict[str, Any]:
     """Migrate a single template to v3.1."""
@@ -147,41 +175,43 @@ def migrate_template(template_path: Path, dry_run: bool = False) -> Dict[str, An
     }
 
     memory_path = template_path / ".aget" / "memory"
+    memory_names = _list_names(memory_path)
 
     # Step 1: Remove prohibited subdirectories
-    prohibited = ["domain", "experiential", "organizational"]
-    for subdir in prohibited:
-        subdir_path = memory_path / subdir
-        if subdir_path.exists():
+    for subdir in PROHIBITED_MEMORY_SUBDIRS:
+        if subdir in memory_names:
+            subdir_path = memory_path / subdir
             action = f"Remove {subdir_path.relative_to(template_path)}"
             results["actions"].append(action)
             if not dry_run:
                 shutil.rmtree(subdir_path)
 
     # Step 2: Add config files
-    config_files = [
-        ("layer_config.yaml", LAYER_CONFIG_YAML),
-        ("inheritance.yaml", INHERITANCE_YAML),
-        ("retrieval.yaml", RETRIEVAL_YAML),
-    ]
-
-    for filename, content in config_files:
+    for filename, data in _MEMORY_CONFIGS:
+        if filename in memory_names:
+            continue
         file_path = memory_path / filename
-        if not file_path.exists():
-            action = f"Create {file_path.relative_to(template_path)}"
-            results["actions"].append(action)
-            if not dry_run:
-                memory_path.mkdir(parents=True, exist_ok=True)
-                with open(file_path, 'w') as f:
-                    f.write(content)
+        if not dry_run:
+            memory_path.mkdir(parents=True, exist_ok=True)
+            # O_EXCL: never clobber a file that appeared since the listing
+            try:
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                continue
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        action = f"Create {file_path.relative_to(template_path)}"
+        results["actions"].append(action)
 
     # Step 3: Ensure core visible directories exist
     archetype = template_path.name.replace("template-", "").replace("-aget", "")
-    visible_dirs = CORE_VISIBLE_DIRS + ARCHETYPE_DIRS.get(archetype, [])
+    existing = _list_names(template_path)
 
-    for dir_name in visible_dirs:
-        dir_path = template_path / dir_name
-        if not dir_path.exists():
+    for dir_name in ARCHETYPE_FULL.get(archetype, CORE_VISIBLE_DIRS):
+        if dir_name not in existing:
+            dir_path = template_path / dir_name
             action = f"Create {dir_name}/"
             results["actions"].append(action)
             if not dry_run:
@@ -224,10 +254,12 @@ def main():
     if args.template:
         templates = [framework_path / args.template]
     else:
-        templates = sorted([
-            p for p in framework_path.iterdir()
-            if p.is_dir() and p.name.startswith("template-") and p.name.endswith("-aget")
-        ])
+        with os.scandir(framework_path) as entries:
+            templates = sorted(
+                Path(e.path) for e in entries
+                if e.name.startswith("template-") and e.name.endswith("-aget")
+                and e.is_dir()
+            )
 
     if not templates:
         print("No templates found")
@@ -238,30 +270,55 @@ def main():
     print()
 
     total_actions = 0
-
-    for template_path in templates:
-        if not template_path.exists():
-            print(f"Skipping {template_path.name}: not found")
-            continue
-
-        results = migrate_template(template_path, dry_run=args.dry_run)
-
-        if results["actions"]:
-            print(f"{template_path.name}:")
-            for action in results["actions"]:
-                print(f"  {action}")
-            total_actions += len(results["actions"])
-        else:
-            print(f"{template_path.name}: Already v3.1 compliant")
-        print()
+    failed = []
+
+    # Templates are independent; migrate them concurrently and report
+    # in the original (sorted) order.
+    present = [p for p in templates if p.exists()]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(present)))
+    ) as executor:
+        futures = {
+            p: executor.submit(migrate_template, p, args.dry_run)
+            for p in present
+        }
+
+        for template_path in templates:
+            if template_path not in futures:
+                print(f"Skipping {template_path.name}: not found")
+                continue
+
+            # A failure in one template must not hide what the others
+            # (already running) changed; report it and carry on
+            try:
+                results = futures[template_path].result()
+            except Exception as e:
+                print(f"{template_path.name}: ERROR {type(e).__name__}: {e}")
+                print()
+                failed.append(template_path.name)
+                continue
+
+            if results["actions"]:
+                print(f"{template_path.name}:")
+                for action in results["actions"]:
+                    print(f"  {action}")
+                total_actions += len(results["actions"])
+            else:
+                print(f"{template_path.name}: Already v3.1 compliant")
+            print()
 
     print("=" * 60)
     print(f"Total actions: {total_actions}")
+    if failed:
+        print(f"Failed templates ({len(failed)}): {', '.join(failed)}")
 
     if args.dry_run:
         print()
         print("DRY RUN complete. Run without --dry-run to apply changes.")
 
+    if failed:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,7 @@ Verifies against deployment targets (template repos), not authoring workspace.
 Usage:
     python3 propagation_audit.py --version 3.6.0 --check       # Verify all targets
     python3 propagation_audit.py --version 3.6.0 --record       # Record current state
+    python3 propagation_audit.py --version 3.6.0 --check --fail-fast  # Stop at first gap
     python3 propagation_audit.py --test                          # Self-test
 
 Specification: AGET_RELEASE_SPEC.md CAP-REL-024
@@ -19,13 +20,35 @@ Exit Codes:
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import os
 import re
+import stat
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Upper bound on template repos audited concurrently
+MAX_AUDIT_WORKERS = 32
+
+# Canonical session scripts every template ships in scripts/ (L598/L599),
+# in report order
+CANONICAL_SCRIPTS = ('wake_up.py', 'wind_down.py', 'study_topic.py')
+_CANONICAL_SET = frozenset(CANONICAL_SCRIPTS)
+
+# Read size for the streaming CHANGELOG search
+CHANGELOG_CHUNK_BYTES = 64 * 1024
+
+# Skill script references: python3 scripts/X.py or python3 .aget/patterns/*/X.py
+_SCRIPT_REF_RE = re.compile(r'python3\s+(scripts/\S+\.py|\.aget/patterns/\S+\.py)')
+
 
 def get_framework_root() -> Path:
     """Find the framework root directory."""
@@ -48,20 +71,118 @@ def get_framework_root() -> Path:
 
 def find_template_repos(framework_root: Path) -> list:
     """Find all template repos."""
-    repos = []
-    for d in sorted(framework_root.iterdir()):
-        if d.is_dir() and d.name.startswith('template-') and d.name.endswith('-aget'):
-            repos.append(d)
+    with os.scandir(framework_root) as entries:
+        repos = [
+            Path(e.path) for e in entries
+            if e.name.startswith('template-') and e.name.endswith('-aget') and e.is_dir()
+        ]
+    repos.sort(key=lambda p: p.name)
     return repos
 
 
-def check_version_file(repo_path: Path, expected_version: str) -> dict:
+def _stat_file(path: Path):
+    """Return os.stat(path) if it is a regular file, else None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _list_repo(repo_path: Path) -> dict:
+    """Map entry name -> os.DirEntry for the top level of a repo.
+
+    audit_repo lists the repo root once and hands the result to every
+    check, so missing items are ruled out without a stat each.
+    """
+    try:
+        with os.scandir(repo_path) as entries:
+            return {e.name: e for e in entries}
+    except OSError:
+        return {}
+
+
+def _root_file_stat(repo_path: Path, name: str, root: dict = None):
+    """stat of a top-level regular file, using the root listing if given."""
+    if root is None:
+        return _stat_file(repo_path / name)
+    entry = root.get(name)
+    if entry is None:
+        return None
+    try:
+        return entry.stat() if entry.is_file() else None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _read_version(path_str: str, mtime_ns: int, size: int):
+    """Version recorded in a version.json, cached per (path, mtime, size).
+
+    Errors propagate and are therefore never cached.
+    """
+    data = _loads(Path(path_str).read_bytes())
+    return data.get('aget_version', data.get('version', 'unknown'))
+
+
+@functools.lru_cache(maxsize=512)
+def _changelog_has(path_str: str, mtime_ns: int, size: int, expected_version: str) -> bool:
+    """Whether a CHANGELOG mentions expected_version, cached per file state.
+
+    Streams the file in binary chunks and stops at the first hit; recent
+    versions are usually near the top.
+    """
+    needle = expected_version.encode('utf-8')
+    if not needle:
+        return True
+    keep = len(needle) - 1
+    tail = b''
+    with open(path_str, 'rb') as f:
+        while True:
+            chunk = f.read(CHANGELOG_CHUNK_BYTES)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if needle in window:
+                return True
+            tail = window[-keep:] if keep else b''
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> str:
+    """Serialize obj as one line of JSON, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode('utf-8')
+    # Same bytes as orjson: compact separators, UTF-8 left unescaped
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=512)
+def _count_yaml(dir_str: str, mtime_ns: int) -> int:
+    """Number of .yaml/.yml entries in a directory, cached per dir mtime."""
+    with os.scandir(dir_str) as entries:
+        return sum(1 for e in entries
+                   if os.path.splitext(e.name)[1] in ('.yaml', '.yml'))
+
+
+def check_version_file(repo_path: Path, expected_version: str, root: dict = None) -> dict:
     """Check if repo's version.json matches expected version."""
     for vpath in [repo_path / '.aget' / 'version.json', repo_path / 'version.json']:
-        if vpath.is_file():
+        if vpath.parent == repo_path:
+            st = _root_file_stat(repo_path, vpath.name, root)
+        elif root is not None and '.aget' not in root:
+            st = None
+        else:
+            st = _stat_file(vpath)
+        if st is not None:
             try:
-                data = json.loads(vpath.read_text())
-                actual = data.get('aget_version', data.get('version', 'unknown'))
+                actual = _read_version(str(vpath), st.st_mtime_ns, st.st_size)
                 return {
                     'file': str(vpath.relative_to(repo_path)),
                     'expected': expected_version,
@@ -73,14 +194,15 @@ def check_version_file(repo_path: Path, expected_version: str) -> dict:
     return {'file': 'version.json', 'error': 'not_found', 'match': False}
 
 
-def check_changelog(repo_path: Path, expected_version: str) -> dict:
+def check_changelog(repo_path: Path, expected_version: str, root: dict = None) -> dict:
     """Check if CHANGELOG.md contains expected version entry."""
     changelog = repo_path / 'CHANGELOG.md'
-    if not changelog.is_file():
+    st = _root_file_stat(repo_path, 'CHANGELOG.md', root)
+    if st is None:
         return {'file': 'CHANGELOG.md', 'error': 'not_found', 'match': False}
     try:
-        content = changelog.read_text(encoding='utf-8')
-        has_entry = expected_version in content
+        has_entry = _changelog_has(str(changelog), st.st_mtime_ns, st.st_size,
+                                   expected_version)
         return {
             'file': 'CHANGELOG.md',
             'expected': expected_version,
@@ -90,30 +212,44 @@ def check_changelog(repo_path: Path, expected_version: str) -> dict:
         return {'file': 'CHANGELOG.md', 'error': str(e), 'match': False}
 
 
-def check_ontology_dir(repo_path: Path) -> dict:
-    """Check if ontology/ directory exists with YAML files."""
+def check_ontology_dir(repo_path: Path, root: dict = None, count_yaml: bool = True) -> dict:
+    """Check if ontology/ directory exists with YAML files.
+
+    Only existence gates completeness; with count_yaml=False the directory
+    is not listed and yaml_count is None.
+    """
     ont_dir = repo_path / 'ontology'
-    if not ont_dir.is_dir():
+    try:
+        if root is None:
+            st = os.stat(ont_dir)
+        else:
+            entry = root.get('ontology')
+            st = entry.stat() if entry is not None and entry.is_dir() else None
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISDIR(st.st_mode):
         return {'exists': False, 'yaml_count': 0}
-    yaml_count = len([f for f in ont_dir.iterdir() if f.suffix in ('.yaml', '.yml')])
-    return {'exists': True, 'yaml_count': yaml_count}
+    if not count_yaml:
+        return {'exists': True, 'yaml_count': None}
+    return {'exists': True, 'yaml_count': _count_yaml(str(ont_dir), st.st_mtime_ns)}
 
 
-def check_canonical_scripts(repo_path: Path) -> dict:
+def check_canonical_scripts(repo_path: Path, root: dict = None) -> dict:
     """Check if canonical session scripts exist in scripts/.
 
     These are Framework_Artifacts that must be present in every template.
     Per L598/L599: scripts/ is the canonical deployment target.
     """
-    canonical = ['wake_up.py', 'wind_down.py', 'study_topic.py']
-    scripts_dir = repo_path / 'scripts'
-    present = []
-    missing = []
-    for script in canonical:
-        if (scripts_dir / script).is_file():
-            present.append(script)
-        else:
-            missing.append(script)
+    on_disk = set()
+    if root is None or 'scripts' in root:
+        try:
+            with os.scandir(repo_path / 'scripts') as entries:
+                on_disk = {e.name for e in entries
+                           if e.name in _CANONICAL_SET and e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    present = [s for s in CANONICAL_SCRIPTS if s in on_disk]
+    missing = [s for s in CANONICAL_SCRIPTS if s not in on_disk]
     return {
         'present': present,
         'missing': missing,
@@ -121,19 +257,23 @@ def check_canonical_scripts(repo_path: Path) -> dict:
     }
 
 
-def check_skill_script_refs(repo_path: Path) -> dict:
+def check_skill_script_refs(repo_path: Path, root: dict = None) -> dict:
     """Check that every skill's script references resolve to existing files.
 
     Per L607 (Referential Integrity): propagating a skill definition without
     its implementing script causes the skill to fail for users.
     """
     skills_dir = repo_path / '.claude' / 'skills'
-    if not skills_dir.is_dir():
+    if (root is not None and '.claude' not in root) or not skills_dir.is_dir():
         return {'checked': 0, 'broken': [], 'complete': True}
 
     broken = []
     checked = 0
-    for skill_dir in sorted(skills_dir.iterdir()):
+    ref_exists = {}  # script_ref -> is_file(); refs repeat across skills
+    with os.scandir(skills_dir) as entries:
+        skill_dirs = [Path(e.path) for e in entries if e.is_dir()]
+    skill_dirs.sort(key=lambda p: p.name)
+    for skill_dir in skill_dirs:
         skill_md = skill_dir / 'SKILL.md'
         if not skill_md.is_file():
             continue
@@ -142,11 +282,16 @@ def check_skill_script_refs(repo_path: Path) -> dict:
         except Exception:
             continue
 
-        # Find script references: python3 scripts/X.py or python3 .aget/patterns/*/X.py
-        for match in re.finditer(r'python3\s+(scripts/\S+\.py|\.aget/patterns/\S+\.py)', content):
+        if 'python3' not in content:
+            continue
+
+        for match in _SCRIPT_REF_RE.finditer(content):
             script_ref = match.group(1)
             checked += 1
-            if not (repo_path / script_ref).is_file():
+            exists = ref_exists.get(script_ref)
+            if exists is None:
+                exists = ref_exists[script_ref] = (repo_path / script_ref).is_file()
+            if not exists:
                 broken.append({
                     'skill': skill_dir.name,
                     'reference': script_ref,
@@ -159,8 +304,81 @@ def check_skill_script_refs(repo_path: Path) -> dict:
     }
 
 
-def audit_propagation(version: str, framework_root: Path) -> dict:
-    """Audit propagation across all template repos (CAP-REL-024-01 through 024-04)."""
+def audit_repo(repo: Path, version: str, fail_fast: bool = False,
+               count_yaml: bool = True) -> dict:
+    """Run every propagation check against one template repo.
+
+    With fail_fast, return as soon as one check marks the repo incomplete.
+    """
+    root = _list_repo(repo)
+    target = {
+        'repo': repo.name,
+        'checks': {},
+        'complete': True,
+        'missing': [],
+    }
+
+    # Check version file
+    ver_check = check_version_file(repo, version, root)
+    target['checks']['version_json'] = ver_check
+    if not ver_check['match']:
+        target['complete'] = False
+        target['missing'].append('version_json')
+
+    if fail_fast and not target['complete']:
+        return target
+
+    # Check changelog
+    cl_check = check_changelog(repo, version, root)
+    target['checks']['changelog'] = cl_check
+    if not cl_check['match']:
+        target['complete'] = False
+        target['missing'].append('changelog')
+
+    if fail_fast and not target['complete']:
+        return target
+
+    # Check ontology directory
+    ont_check = check_ontology_dir(repo, root, count_yaml=count_yaml)
+    target['checks']['ontology'] = ont_check
+    if not ont_check['exists']:
+        target['complete'] = False
+        target['missing'].append('ontology')
+
+    if fail_fast and not target['complete']:
+        return target
+
+    # Check canonical scripts (L598/L599)
+    scripts_check = check_canonical_scripts(repo, root)
+    target['checks']['canonical_scripts'] = scripts_check
+    if not scripts_check['complete']:
+        target['complete'] = False
+        target['missing'].append(f"scripts({','.join(scripts_check['missing'])})")
+
+    if fail_fast and not target['complete']:
+        return target
+
+    # Check skill→script referential integrity (L607)
+    refs_check = check_skill_script_refs(repo, root)
+    target['checks']['skill_script_refs'] = refs_check
+    if not refs_check['complete']:
+        target['complete'] = False
+        for b in refs_check['broken']:
+            target['missing'].append(f"ref({b['skill']}→{b['reference']})")
+
+    return target
+
+
+def audit_propagation(version: str, framework_root: Path, fail_fast: bool = False,
+                      count_yaml: bool = True) -> dict:
+    """Audit propagation across all template repos (CAP-REL-024-01 through 024-04).
+
+    With fail_fast, stop at the first incomplete target (in repo order) and
+    mark the record partial. count_yaml=False skips counting ontology YAML
+    files, which only matters for a recorded state.
+    """
+    from datetime import datetime, timezone  # deferred: unused by --help
+
     repos = find_template_repos(framework_root)
 
     record = {
@@ -171,54 +389,23 @@ def audit_propagation(version: str, framework_root: Path) -> dict:
         'all_complete': True,
     }
 
-    for repo in repos:
-        target = {
-            'repo': repo.name,
-            'checks': {},
-            'complete': True,
-            'missing': [],
-        }
-
-        # Check version file
-        ver_check = check_version_file(repo, version)
-        target['checks']['version_json'] = ver_check
-        if not ver_check['match']:
-            target['complete'] = False
-            target['missing'].append('version_json')
-
-        # Check changelog
-        cl_check = check_changelog(repo, version)
-        target['checks']['changelog'] = cl_check
-        if not cl_check['match']:
-            target['complete'] = False
-            target['missing'].append('changelog')
-
-        # Check ontology directory
-        ont_check = check_ontology_dir(repo)
-        target['checks']['ontology'] = ont_check
-        if not ont_check['exists']:
-            target['complete'] = False
-            target['missing'].append('ontology')
-
-        # Check canonical scripts (L598/L599)
-        scripts_check = check_canonical_scripts(repo)
-        target['checks']['canonical_scripts'] = scripts_check
-        if not scripts_check['complete']:
-            target['complete'] = False
-            target['missing'].append(f"scripts({','.join(scripts_check['missing'])})")
-
-        # Check skill→script referential integrity (L607)
-        refs_check = check_skill_script_refs(repo)
-        target['checks']['skill_script_refs'] = refs_check
-        if not refs_check['complete']:
-            target['complete'] = False
-            for b in refs_check['broken']:
-                target['missing'].append(f"ref({b['skill']}→{b['reference']})")
-
-        if not target['complete']:
-            record['all_complete'] = False
-
-        record['targets'].append(target)
+    # Repos are independent and the checks are I/O bound: audit them
+    # concurrently, collecting results in repo order.
+    if repos:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_AUDIT_WORKERS, len(repos))
+        ) as executor:
+            futures = [executor.submit(audit_repo, repo, version, fail_fast, count_yaml)
+                       for repo in repos]
+            for future in futures:
+                target = future.result()
+                record['targets'].append(target)
+                if fail_fast and not target['complete']:
+                    record['partial'] = True
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+    record['all_complete'] = all(t['complete'] for t in record['targets'])
 
     return record
 
@@ -232,6 +419,20 @@ def get_log_path(agent_path: Path = None) -> Path:
     return log_dir / 'propagation_log.jsonl'
 
 
+def append_records(log_path: Path, records) -> None:
+    """Append records to a JSONL log with a single O_APPEND write."""
+    data = ''.join(_dumps(r) + '\n' for r in records).encode('utf-8')
+    if not data:
+        return
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def run_self_test() -> bool:
     """Self-test for propagation_audit.py."""
     import tempfile
@@ -331,8 +532,8 @@ def run_self_test() -> bool:
 
         # T7: Record serializable to JSONL
         try:
-            line = json.dumps(record) + '\n'
-            parsed = json.loads(line.strip())
+            line = _dumps(record) + '\n'
+            parsed = _loads(line.strip().encode('utf-8'))
             if parsed['aget_version'] == '3.6.0':
                 print("  [+] T7 PASS: Record serializes to JSONL")
                 passed += 1
@@ -359,6 +560,8 @@ def main():
     parser.add_argument('--check', action='store_true', help='Check propagation and report')
     parser.add_argument('--record', action='store_true', help='Record propagation state to log')
     parser.add_argument('--framework-dir', type=Path, help='Framework root directory')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Stop at the first incomplete target (use with --check)')
     parser.add_argument('--test', action='store_true', help='Run self-test')
     args = parser.parse_args()
 
@@ -371,12 +574,12 @@ def main():
         parser.error("--version is required")
 
     framework_root = args.framework_dir or get_framework_root()
-    record = audit_propagation(args.version, framework_root)
+    record = audit_propagation(args.version, framework_root, fail_fast=args.fail_fast,
+                               count_yaml=args.record)
 
     if args.record:
         log_path = get_log_path()
-        with open(log_path, 'a') as f:
-            f.write(json.dumps(record) + '\n')
+        append_records(log_path, [record])
         print(f"Propagation record written to: {log_path}")
 
     # Report
@@ -395,6 +598,8 @@ def main():
     else:
         incomplete = [t['repo'] for t in record['targets'] if not t['complete']]
         print(f"\nFAIL: {len(incomplete)} target(s) incomplete")
+        if record.get('partial'):
+            print("(--fail-fast: stopped at the first incomplete target)")
 
     if args.check and not record['all_complete']:
         sys.exit(1)
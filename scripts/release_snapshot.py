@@ -9,6 +9,7 @@ Usage:
     python3 release_snapshot.py --version 3.6.0 --phase pre     # Pre-release snapshot
     python3 release_snapshot.py --version 3.6.0 --phase post    # Post-release snapshot
     python3 release_snapshot.py --version 3.6.0 --diff          # Generate diff
+    python3 release_snapshot.py --version 3.6.0 --phase pre --pretty  # Indented snapshot
     python3 release_snapshot.py --test                           # Self-test
 
 Specification: AGET_RELEASE_SPEC.md CAP-REL-023
@@ -21,13 +22,41 @@ Exit Codes:
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
+import re
 import subprocess
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Upper bound on repos captured concurrently (file reads + `gh release view`)
+CAPTURE_MAX_WORKERS = 16
+
+# Per-repo snapshot fields, in capture_repo_state order
+_SNAPSHOT_KEYS = ('version_json', 'changelog_latest', 'github_release')
+_SNAPSHOT_KEY_SET = frozenset(_SNAPSHOT_KEYS)
+
+# First version header in a CHANGELOG: "## [v]X.Y.Z" / "# X.Y.Z"
+_CHANGELOG_VERSION_RE = re.compile(r'##?\s*\[?v?(\d+\.\d+\.\d+)')
+
+
+def _utcnow_iso() -> str:
+    """UTC timestamp formatted like datetime.now(timezone.utc).isoformat()."""
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(secs)
+    us = ns // 1000
+    frac = f'.{us:06d}' if us else ''
+    return (f'{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}'
+            f'T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}{frac}+00:00')
+
 
 def get_framework_root() -> Path:
     """Find the framework root directory."""
@@ -56,39 +85,81 @@ def find_repos(framework_root: Path) -> list:
     gh#1287 fix 2026-05-10: glob is case-insensitive on suffix to catch
     template-document-processor-AGET (uppercase suffix per CLAUDE.md).
     """
-    repos = []
-    aget_dir = framework_root / 'aget'
-    if aget_dir.is_dir():
-        repos.append(aget_dir)
-    for d in sorted(framework_root.iterdir()):
-        name_lower = d.name.lower()
-        if d.is_dir() and name_lower.startswith('template-') and name_lower.endswith('-aget'):
-            repos.append(d)
+    aget_dir = None
+    templates = []
+    # One scandir pass; DirEntry.is_dir() reuses the readdir type where
+    # the filesystem provides it instead of a stat per entry
+    with os.scandir(framework_root) as entries:
+        for entry in entries:
+            name_lower = entry.name.lower()
+            if entry.name == 'aget':
+                if entry.is_dir():
+                    aget_dir = Path(entry.path)
+            elif name_lower.startswith('template-') and name_lower.endswith('-aget') and entry.is_dir():
+                templates.append(entry.name)
+    repos = [aget_dir] if aget_dir is not None else []
+    repos.extend(framework_root / name for name in sorted(templates))
     return repos
 
 
+def _loads(data: bytes):
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes: compact (orjson if available) or indented."""
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
 def read_version_json(repo_path: Path) -> str:
     """Read version from version.json or .aget/version.json."""
     for vpath in [repo_path / '.aget' / 'version.json', repo_path / 'version.json']:
-        if vpath.is_file():
-            try:
-                data = json.loads(vpath.read_text())
-                return data.get('aget_version', data.get('version', 'unknown'))
-            except Exception:
-                pass
+        # EAFP: a missing file (or a directory) fails the read, so no
+        # separate is_file() stat is needed
+        try:
+            data = _loads(vpath.read_bytes())
+            return data.get('aget_version', data.get('version', 'unknown'))
+        except Exception:
+            pass
     return 'not_found'
 
 
 def read_changelog_latest(repo_path: Path) -> str:
     """Read the latest version from CHANGELOG.md."""
     changelog = repo_path / 'CHANGELOG.md'
-    if not changelog.is_file():
+    try:
+        f = changelog.open('r', encoding='utf-8')
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         return 'not_found'
+    except Exception:
+        return 'error'
     try:
-        import re
-        content = changelog.read_text(encoding='utf-8')
-        match = re.search(r'##?\s*\[?v?(\d+\.\d+\.\d+)', content)
-        return match.group(1) if match else 'unknown'
+        # Stream lines and stop at the first header instead of reading the
+        # whole file. `pending` keeps only a trailing "#"/"##" whose match
+        # could still continue onto the next line (\s* spans newlines).
+        pending = ''
+        with f:
+            for line in f:
+                pending += line
+                match = _CHANGELOG_VERSION_RE.search(pending)
+                if match:
+                    return match.group(1)
+                tail = pending.rstrip()
+                if tail.endswith('#'):
+                    cut = len(tail) - 1
+                    if cut and tail[cut - 1] == '#':
+                        cut -= 1
+                    pending = pending[cut:]
+                else:
+                    pending = ''
+        return 'unknown'
     except Exception:
         return 'error'
 
@@ -108,27 +179,41 @@ def check_github_release(repo_path: Path, version: str) -> str:
         return 'gh_unavailable'
 
 
+def capture_repo_state(repo: Path, version: str, skip_gh: bool = False) -> dict:
+    """Capture the release state of one repo."""
+    repo_state = {
+        'version_json': read_version_json(repo),
+        'changelog_latest': read_changelog_latest(repo),
+    }
+    if not skip_gh:
+        repo_state['github_release'] = check_github_release(repo, version)
+    return repo_state
+
+
 def capture_snapshot(version: str, phase: str, framework_root: Path,
                      skip_gh: bool = False) -> dict:
     """Capture release state snapshot (CAP-REL-023-01, 023-02, 023-03)."""
     repos = find_repos(framework_root)
 
     snapshot = {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': _utcnow_iso(),
         'aget_version': version,
         'phase': phase,
         'repos': {},
     }
-
-    for repo in repos:
-        repo_state = {
-            'version_json': read_version_json(repo),
-            'changelog_latest': read_changelog_latest(repo),
-        }
-        if not skip_gh:
-            repo_state['github_release'] = check_github_release(repo, version)
-
-        snapshot['repos'][repo.name] = repo_state
+    if not repos:
+        return snapshot
+
+    # Repos are independent and the work is I/O (file reads, gh subprocess
+    # and network), so capture them on a thread pool. map() keeps the
+    # find_repos order.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(CAPTURE_MAX_WORKERS, len(repos))
+    ) as executor:
+        states = executor.map(
+            lambda repo: capture_repo_state(repo, version, skip_gh), repos
+        )
+        snapshot['repos'] = dict(zip([repo.name for repo in repos], states))
 
     return snapshot
 
@@ -136,7 +221,7 @@ def capture_snapshot(version: str, phase: str, framework_root: Path,
 def generate_diff(pre_snapshot: dict, post_snapshot: dict) -> dict:
     """Generate diff between pre and post snapshots (CAP-REL-023-04, 023-05)."""
     diff = {
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': _utcnow_iso(),
         'aget_version': pre_snapshot.get('aget_version', 'unknown'),
         'changes': {},
         'gaps': [],
@@ -145,23 +230,30 @@ def generate_diff(pre_snapshot: dict, post_snapshot: dict) -> dict:
     pre_repos = pre_snapshot.get('repos', {})
     post_repos = post_snapshot.get('repos', {})
 
-    all_repos = set(pre_repos) | set(post_repos)
-    for repo_name in sorted(all_repos):
+    target_version = pre_snapshot.get('aget_version', '')
+    for repo_name in sorted(pre_repos.keys() | post_repos.keys()):
         pre = pre_repos.get(repo_name, {})
         post = post_repos.get(repo_name, {})
 
-        repo_diff = {}
-        for key in set(pre) | set(post):
-            pre_val = pre.get(key, 'missing')
-            post_val = post.get(key, 'missing')
-            if pre_val != post_val:
-                repo_diff[key] = {'before': pre_val, 'after': post_val}
-
-        if repo_diff:
-            diff['changes'][repo_name] = repo_diff
+        # Unchanged repos (every repo on a no-op release) skip the per-key
+        # walk; the dict comparison runs in C
+        if pre != post:
+            repo_diff = {}
+            # Known fields in schema order; fields from other snapshot
+            # versions (rare) follow in the order they appear
+            keys = [k for k in _SNAPSHOT_KEYS if k in pre or k in post]
+            if not (pre.keys() <= _SNAPSHOT_KEY_SET and post.keys() <= _SNAPSHOT_KEY_SET):
+                keys.extend(k for k in {**pre, **post} if k not in _SNAPSHOT_KEY_SET)
+            for key in keys:
+                pre_val = pre.get(key, 'missing')
+                post_val = post.get(key, 'missing')
+                if pre_val != post_val:
+                    repo_diff[key] = {'before': pre_val, 'after': post_val}
+
+            if repo_diff:
+                diff['changes'][repo_name] = repo_diff
 
         # CAP-REL-023-05: Flag unexpected unchanged items
-        target_version = pre_snapshot.get('aget_version', '')
         if post.get('version_json') == pre.get('version_json') and pre.get('version_json') != target_version:
             diff['gaps'].append(f"{repo_name}: version_json not bumped (still {pre.get('version_json')})")
         if post.get('github_release') == 'not_found':
@@ -265,6 +357,7 @@ def main():
     parser.add_argument('--diff', action='store_true', help='Generate diff from pre/post snapshots')
     parser.add_argument('--framework-dir', type=Path, help='Framework root directory')
     parser.add_argument('--skip-gh', action='store_true', help='Skip GitHub release checks')
+    parser.add_argument('--pretty', action='store_true', help='Write indented snapshot JSON')
     parser.add_argument('--test', action='store_true', help='Run self-test')
     args = parser.parse_args()
 
@@ -285,11 +378,12 @@ def main():
         if not pre_path.is_file() or not post_path.is_file():
             print(f"ERROR: Need both pre and post snapshots", file=sys.stderr)
             sys.exit(2)
-        pre = json.loads(pre_path.read_text())
-        post = json.loads(post_path.read_text())
+        pre = _loads(pre_path.read_bytes())
+        post = _loads(post_path.read_bytes())
         diff = generate_diff(pre, post)
         diff_path = snapshot_dir / f'v{args.version}_diff.json'
-        diff_path.write_text(json.dumps(diff, indent=2))
+        # The diff is read by people; keep it indented
+        diff_path.write_bytes(_dumps(diff, pretty=True))
         print(f"Diff written to: {diff_path}")
         if diff['gaps']:
             print(f"GAPS ({len(diff['gaps'])}):")
@@ -300,7 +394,8 @@ def main():
     elif args.phase:
         snapshot = capture_snapshot(args.version, args.phase, framework_root, args.skip_gh)
         out_path = snapshot_dir / f'v{args.version}_{args.phase}.json'
-        out_path.write_text(json.dumps(snapshot, indent=2))
+        # Snapshots are machine-read (--diff); write compact unless --pretty
+        out_path.write_bytes(_dumps(snapshot, pretty=args.pretty))
         print(f"Snapshot ({args.phase}) written to: {out_path}")
         print(f"Repos captured: {len(snapshot['repos'])}")
     else:
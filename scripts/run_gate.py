@@ -34,6 +34,9 @@ Usage:
     # Self-test:
     python3 run_gate.py --test
 
+    # Pin the agent root (skips the upward .aget/ search):
+    AGET_AGENT_ROOT=/path/to/agent python3 run_gate.py --history
+
 Exit Codes:
     0: Gate recorded / check passed / test passed
     1: Gate blocked (prior gate not passed)
@@ -42,14 +45,72 @@ Exit Codes:
 """
 
 import argparse
+import atexit
+import functools
 import json
+import os
+import re
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Read size when scanning gate_log.jsonl backwards from the end
+GATE_LOG_CHUNK_BYTES = 64 * 1024
+
+# gate_log.jsonl is rotated to gate_log.<UTC stamp>.jsonl once it reaches
+# this size, so prior-gate checks stay bounded to the recent log
+GATE_LOG_ROTATE_BYTES = 16 * 1024 * 1024
+
+# PASS/FAIL tokens in a validation summary (substring match, as str.count)
+_CHECK_TOKEN_RE = re.compile(r'PASS|FAIL')
+
+# O_APPEND descriptors for gate logs, opened once per path and closed at exit
+_LOG_FDS = {}
+
+
+def _close_log_fds() -> None:
+    """Close cached gate log descriptors (registered with atexit)."""
+    for fd in _LOG_FDS.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _LOG_FDS.clear()
+
+
+atexit.register(_close_log_fds)
+
 
+def _utcnow_iso() -> str:
+    """Current UTC time in datetime.isoformat() form, without a datetime.
+
+    Same text as datetime.now(timezone.utc).isoformat(): microseconds are
+    omitted when zero.
+    """
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.gmtime(secs)
+    us = ns // 1000
+    frac = f'.{us:06d}' if us else ''
+    return (f'{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}'
+            f'T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}{frac}+00:00')
+
+
+@functools.lru_cache(maxsize=None)
 def get_agent_root() -> Path:
-    """Find agent root by looking for .aget/ directory."""
+    """Find agent root by looking for .aget/ directory.
+
+    AGET_AGENT_ROOT, when set, is used as-is and skips the upward search.
+    The result is cached for the life of the process.
+    """
+    env_dir = os.environ.get('AGET_AGENT_ROOT')
+    if env_dir:
+        return Path(env_dir)
     current = Path(__file__).resolve().parent
     for _ in range(10):
         if (current / '.aget').is_dir():
@@ -58,30 +119,30 @@ def get_agent_root() -> Path:
     return Path.cwd()
 
 
+@functools.lru_cache(maxsize=None)
 def get_aget_version(agent_root: Path) -> str:
-    """Read aget_version from .aget/version.json."""
+    """Read aget_version from .aget/version.json.
+
+    Cached per agent_root for the life of the process; call
+    get_aget_version.cache_clear() after rewriting version.json.
+    """
     version_file = agent_root / '.aget' / 'version.json'
-    if version_file.exists():
-        try:
-            with open(version_file) as f:
-                data = json.load(f)
-                return data.get('aget_version', 'unknown')
-        except (json.JSONDecodeError, IOError):
-            pass
-    return 'unknown'
+    try:
+        data = _loads(version_file.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return 'unknown'
+    return data.get('aget_version', 'unknown')
 
 
+@functools.lru_cache(maxsize=None)
 def get_agent_name(agent_root: Path) -> str:
-    """Read agent name from .aget/identity.json."""
+    """Read agent name from .aget/identity.json (cached per agent_root)."""
     identity_file = agent_root / '.aget' / 'identity.json'
-    if identity_file.exists():
-        try:
-            with open(identity_file) as f:
-                data = json.load(f)
-                return data.get('name', 'unknown')
-        except (json.JSONDecodeError, IOError):
-            pass
-    return 'unknown'
+    try:
+        data = _loads(identity_file.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return 'unknown'
+    return data.get('name', 'unknown')
 
 
 def ensure_logs_dir(agent_root: Path) -> Path:
@@ -96,28 +157,149 @@ def get_gate_log_path(agent_root: Path) -> Path:
     return ensure_logs_dir(agent_root) / 'gate_log.jsonl'
 
 
-def read_gate_log(agent_root: Path) -> list:
-    """Read all gate records from gate_log.jsonl."""
+def _loads(data: bytes):
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _rotated_gate_logs(logs_dir: Path) -> list:
+    """Return rotated gate logs (gate_log.<stamp>.jsonl), oldest first."""
+    try:
+        with os.scandir(logs_dir) as entries:
+            names = [
+                e.name for e in entries
+                if e.name.startswith('gate_log.') and e.name.endswith('.jsonl')
+                and e.name != 'gate_log.jsonl'
+            ]
+    except FileNotFoundError:
+        return []
+    # UTC stamps sort chronologically as text
+    return [logs_dir / name for name in sorted(names)]
+
+
+def rotate_gate_log(agent_root: Path, max_bytes: int = GATE_LOG_ROTATE_BYTES):
+    """Rotate gate_log.jsonl once it reaches max_bytes.
+
+    The current log is renamed to gate_log.<UTC stamp>.jsonl and a fresh
+    log is started on the next append. Rotated logs are kept; prior-gate
+    lookups and --history still read them. Returns the rotated path, or
+    None if no rotation was needed.
+    """
+    log_file = get_gate_log_path(agent_root)
+    try:
+        if log_file.stat().st_size < max_bytes:
+            return None
+    except FileNotFoundError:
+        return None
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime(secs)) + f'{ns // 1000:06d}Z'
+    rotated = log_file.with_name(f'gate_log.{stamp}.jsonl')
+    os.rename(log_file, rotated)
+    # A cached descriptor would keep appending to the rotated file
+    fd = _LOG_FDS.pop(log_file, None)
+    if fd is not None:
+        os.close(fd)
+    return rotated
+
+
+def _json_needle(text: str) -> bytes:
+    """Bytes that json.dumps output must contain for a string field == text.
+
+    Only plain printable ASCII is written verbatim; for anything else
+    return b'' (matches every line) so the prefilter never drops a record.
+    """
+    if text.isascii() and text.isprintable() and not ('"' in text or '\\' in text):
+        return text.encode('ascii')
+    return b''
+
+
+def read_gate_log(agent_root: Path, include_rotated: bool = False,
+                  version: str = None) -> list:
+    """Read gate records from gate_log.jsonl, oldest first.
+
+    include_rotated also reads rotated logs, ahead of the current one.
+    version keeps only records with that aget_version; lines that cannot
+    contain it are skipped before parsing.
+    """
     log_file = get_gate_log_path(agent_root)
+    paths = _rotated_gate_logs(log_file.parent) if include_rotated else []
+    paths.append(log_file)
+    needle = _json_needle(version) if version else b''
     records = []
-    if log_file.exists():
-        with open(log_file) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        records.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        # One read, then parse each line (orjson.JSONDecodeError subclasses
+        # json.JSONDecodeError, so malformed lines are skipped either way)
+        for line in data.split(b'\n'):
+            line = line.strip()
+            if not line or needle not in line:
+                continue
+            try:
+                record = _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if version and (not isinstance(record, dict)
+                            or record.get('aget_version') != version):
+                continue
+            records.append(record)
     return records
 
 
-def find_gate_record(records: list, gate_id: str, version: str = None) -> dict:
-    """Find the most recent record for a gate, optionally filtered by version."""
-    matching = [r for r in records if r.get('gate_id') == gate_id]
-    if version:
-        matching = [r for r in matching if r.get('aget_version') == version]
-    return matching[-1] if matching else None
+def _iter_lines_reversed(path: Path, chunk_size: int = GATE_LOG_CHUNK_BYTES):
+    """Yield the lines of path (as bytes) from last to first.
+
+    Reads fixed-size chunks backwards from the end of the file, so
+    callers that stop early never touch the older part of the log.
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, 2)
+        tail = b''
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b'\n')
+            # lines[0] may continue in the previous chunk
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        yield tail
+
+
+def find_latest_gate_record(agent_root: Path, gate_id: str, version: str = None) -> dict:
+    """Find the most recent record for a gate, optionally filtered by version.
+
+    Scans the current log and then rotated logs backwards, stopping at the
+    newest match instead of parsing every record.
+    """
+    log_file = get_gate_log_path(agent_root)
+    # Byte prefilter: records are written with json.dumps, so a plain
+    # gate_id appears verbatim in its line
+    needle = _json_needle(gate_id)
+    # Current log first, then rotated logs newest first
+    for path in [log_file] + _rotated_gate_logs(log_file.parent)[::-1]:
+        try:
+            for line in _iter_lines_reversed(path):
+                line = line.strip()
+                if not line or needle not in line:
+                    continue
+                try:
+                    record = _loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if not isinstance(record, dict) or record.get('gate_id') != gate_id:
+                    continue
+                if version and record.get('aget_version') != version:
+                    continue
+                return record
+        except FileNotFoundError:
+            continue
+    return None
 
 
 def check_prior_gate(agent_root: Path, prior_gate: str, version: str) -> tuple:
@@ -125,8 +307,7 @@ def check_prior_gate(agent_root: Path, prior_gate: str, version: str) -> tuple:
 
     Returns (allowed: bool, reason: str).
     """
-    records = read_gate_log(agent_root)
-    prior = find_gate_record(records, prior_gate, version)
+    prior = find_latest_gate_record(agent_root, prior_gate, version)
 
     if prior is None:
         return False, f"BLOCKED: No record for gate '{prior_gate}' (version {version})"
@@ -149,7 +330,7 @@ def create_gate_record(
     """Create a Gate_Record per CAP-REL-022-02."""
     record = {
         'gate_id': gate_id,
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': _utcnow_iso(),
         'aget_version': aget_version,
         'status': status,
         'checks_total': checks_total,
@@ -166,8 +347,12 @@ def create_gate_record(
 def append_gate_record(agent_root: Path, record: dict) -> Path:
     """Append record to gate_log.jsonl. Returns log file path."""
     log_file = get_gate_log_path(agent_root)
-    with open(log_file, 'a') as f:
-        f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    fd = _LOG_FDS.get(log_file)
+    if fd is None:
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        _LOG_FDS[log_file] = fd
+    # One write per record; O_APPEND keeps concurrent writers line-atomic
+    os.write(fd, (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8'))
     return log_file
 
 
@@ -184,10 +369,11 @@ def record_gate(args, agent_root: Path) -> int:
             print(reason, file=sys.stderr)
             return 1
 
-    # Parse checks from summary
-    checks_total = args.summary.count('PASS') + args.summary.count('FAIL')
-    checks_passed = args.summary.count('PASS')
-    checks_failed = args.summary.count('FAIL')
+    # Parse checks from summary in one scan
+    tokens = _CHECK_TOKEN_RE.findall(args.summary)
+    checks_total = len(tokens)
+    checks_passed = tokens.count('PASS')
+    checks_failed = checks_total - checks_passed
 
     record = create_gate_record(
         gate_id=args.gate,
@@ -201,6 +387,7 @@ def record_gate(args, agent_root: Path) -> int:
         checks_failed=checks_failed,
     )
 
+    rotate_gate_log(agent_root)
     log_file = append_gate_record(agent_root, record)
     print(f"Gate '{args.gate}' recorded as '{args.status}' in {log_file.relative_to(agent_root)}")
 
@@ -223,9 +410,7 @@ def check_gate(args, agent_root: Path) -> int:
 
 def show_history(args, agent_root: Path) -> int:
     """Show gate history, optionally filtered by version."""
-    records = read_gate_log(agent_root)
-    if args.version:
-        records = [r for r in records if r.get('aget_version') == args.version]
+    records = read_gate_log(agent_root, include_rotated=True, version=args.version)
 
     if not records:
         print("No gate records found.")
@@ -24,14 +24,36 @@ Version: 1.0.0 (v3.1.0)
 """
 
 import argparse
+import concurrent.futures
+import io
 import json
+import os
 import re
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # =============================================================================
 # Configuration
@@ -45,6 +67,14 @@ CLI_FILES = {
     'windsurf': '.windsurfrules',
 }
 
+# Alternatives of PATTERNS['secrets'], kept separate for hyperscan
+SECRET_EXPRESSIONS = (
+    r'API_KEY',
+    r'SECRET',
+    r'PASSWORD',
+    r'TOKEN\s*=\s*["\'][^"\']+["\']',
+)
+
 # Validation patterns
 PATTERNS = {
     'version_tag': r'@aget-version:\s*[\d.]+|Version:\s*[\d.]+',
@@ -52,9 +82,116 @@ PATTERNS = {
     'session_protocol': r'wake up|Wind Down|Session Protocol',
     'hardcoded_path': r'/Users/|/home/|C:\\\\',
     'aget_reference': r'\.aget/',
-    'secrets': r'API_KEY|SECRET|PASSWORD|TOKEN\s*=\s*["\'][^"\']+["\']',
+    'secrets': '|'.join(SECRET_EXPRESSIONS),
 }
 
+# Upper bound on CLI files validated concurrently
+MAX_FILE_WORKERS = 8
+
+# Files larger than this are reported as errors without being read
+MAX_FILE_BYTES = 1024 * 1024
+
+# Literal forms of PATTERNS['hardcoded_path'], for a substring pre-check
+HARDCODED_ANCHORS = ('/Users/', '/home/', 'C:\\\\')
+
+# Checks that match case-insensitively; the rest are case-sensitive
+_IGNORECASE_CHECKS = frozenset({'version_tag', 'north_star', 'session_protocol'})
+
+
+def _compile(pattern: str, ignorecase: bool = False):
+    """Compile pattern with google-re2 (linear time) if available, else re.
+
+    RE2 has no backtracking, so file content can't trigger pathological
+    matching; its \\d and \\s are ASCII-only, which is all these
+    patterns need.
+    """
+    if HAS_RE2:
+        try:
+            return re2.compile(('(?i)' if ignorecase else '') + pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE if ignorecase else 0)
+
+
+# PATTERNS compiled once at import, with each check's flags
+COMPILED_PATTERNS = {
+    name: _compile(pattern, name in _IGNORECASE_CHECKS)
+    for name, pattern in PATTERNS.items()
+}
+
+# Per-check patterns bound once, for the per-file code paths
+_RE_VERSION = COMPILED_PATTERNS['version_tag']
+_RE_NORTH_STAR = COMPILED_PATTERNS['north_star']
+_RE_SESSION = COMPILED_PATTERNS['session_protocol']
+_RE_HARDCODED_PATH = COMPILED_PATTERNS['hardcoded_path']
+_RE_AGET_REFERENCE = COMPILED_PATTERNS['aget_reference']
+_RE_SECRETS = COMPILED_PATTERNS['secrets']
+
+# CLI_FILES as a tuple of (cli_name, filename) pairs
+_CLI_FILE_ITEMS = tuple(CLI_FILES.items())
+
+# Version number after a version tag (case-sensitive)
+VERSION_EXTRACT_RE = _compile(r'@aget-version:\s*([\d.]+)|Version:\s*([\d.]+)')
+
+
+def _hs_whitespace_class() -> str:
+    """Python's str \\s as an explicit hyperscan character class.
+
+    Hyperscan's Unicode \\s differs from re's (\\x1c-\\x1f, U+180E), so the
+    code points are listed out. All Unicode whitespace is below U+3001.
+    """
+    space = re.compile(r'\s')
+    return '[' + ''.join(
+        f'\\x{{{cp:x}}}' for cp in range(0x3001) if space.match(chr(cp))
+    ) + ']'
+
+
+def _build_secrets_db():
+    """Compile SECRET_EXPRESSIONS into a hyperscan block-mode database.
+
+    Returns None when hyperscan is unavailable or rejects the patterns;
+    has_secrets() then uses the regex instead.
+    """
+    if not HAS_HYPERSCAN:
+        return None
+    whitespace = _hs_whitespace_class()
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[
+                expr.replace(r'\s', whitespace).encode('ascii')
+                for expr in SECRET_EXPRESSIONS
+            ],
+            ids=list(range(len(SECRET_EXPRESSIONS))),
+            elements=len(SECRET_EXPRESSIONS),
+            # Match on code points with Unicode classes, like re on str
+            flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(SECRET_EXPRESSIONS),
+        )
+        return db
+    except Exception:
+        return None
+
+
+_SECRETS_DB = _build_secrets_db()
+# A database's scratch space is not shareable between concurrent scans
+_SECRETS_DB_LOCK = threading.Lock()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to JSON text, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
 
 # =============================================================================
 # Timing
@@ -73,20 +210,73 @@ def log_diagnostic(msg: str) -> None:
 # Validation Functions
 # =============================================================================
 
-def find_cli_files(agent_path: Path) -> Dict[str, Path]:
-    """Find all CLI settings files in agent."""
+def _find_cli_entries(agent_path: Path) -> Dict[str, os.DirEntry]:
+    """Map CLI name to the directory entry of its settings file.
+
+    One directory listing replaces a stat per CLI_FILES name. Any entry
+    counts, as with Path.exists() (a directory is reported by
+    validate_file as a read error), except one whose stat fails, such
+    as a dangling symlink. That stat is cached on the entry, so the
+    size check in _validate_cli_file reuses it.
+    """
+    try:
+        with os.scandir(agent_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
     found = {}
-    for cli_name, filename in CLI_FILES.items():
-        file_path = agent_path / filename
-        if file_path.exists():
-            found[cli_name] = file_path
+    for cli_name, filename in _CLI_FILE_ITEMS:
+        entry = entries.get(filename)
+        if entry is None:
+            continue
+        try:
+            entry.stat()
+        except OSError:
+            continue
+        found[cli_name] = entry
     return found
 
 
-def validate_file(file_path: Path) -> Dict[str, Any]:
+def find_cli_files(agent_path: Path) -> Dict[str, Path]:
+    """Find all CLI settings files in agent."""
+    return {
+        cli_name: agent_path / entry.name
+        for cli_name, entry in _find_cli_entries(agent_path).items()
+    }
+
+
+def has_secrets(content: str) -> bool:
+    """True if content matches PATTERNS['secrets'].
+
+    Uses the hyperscan database (all alternatives in one SIMD pass) when
+    available, else the compiled regex.
+    """
+    if _SECRETS_DB is not None:
+        hits = []
+
+        def on_match(*match):
+            hits.append(match[0])
+            return True  # stop at the first hit
+
+        with _SECRETS_DB_LOCK:
+            try:
+                _SECRETS_DB.scan(content.encode('utf-8'), match_event_handler=on_match)
+            except hyperscan.error:
+                # Stopping the scan from the handler raises ScanTerminated
+                if not hits:
+                    raise
+        return bool(hits)
+    return _RE_SECRETS.search(content) is not None
+
+
+def validate_file(file_path: Path, content: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate a single CLI settings file.
 
+    content, if given, is the already-read file text; otherwise the file
+    is read here.
+
     Returns validation result.
     """
     result = {
@@ -98,18 +288,38 @@ def validate_file(file_path: Path) -> Dict[str, Any]:
         'warnings': [],
     }
 
-    try:
-        content = file_path.read_text()
-    except IOError as e:
+    if content is None:
+        try:
+            # Size cap before reading, so an oversized file is never loaded
+            size = file_path.stat().st_size
+            if size > MAX_FILE_BYTES:
+                result['passed'] = False
+                result['size_kb'] = round(size / 1024, 1)
+                result['errors'].append(
+                    f"File size {size / 1024:.1f}KB exceeds {MAX_FILE_BYTES // 1024}KB limit; not scanned"
+                )
+                return result
+            content = file_path.read_text()
+        except IOError as e:
+            result['passed'] = False
+            result['errors'].append(f"Read error: {e}")
+            return result
+
+    # Security: No secrets. Checked first: a hit fails the file, so the
+    # warning-only checks below are skipped. Only presence matters, so
+    # search stops at the first hit.
+    if has_secrets(content):
+        result['checks']['no_secrets'] = False
+        result['errors'].append("Potential secrets found in file")
         result['passed'] = False
-        result['errors'].append(f"Read error: {e}")
+        result['size_kb'] = round(len(content) / 1024, 1)
         return result
 
     # R-CLI-003: Version tag present
-    if re.search(PATTERNS['version_tag'], content, re.IGNORECASE):
+    if _RE_VERSION.search(content):
         result['checks']['version_tag'] = True
         # Extract version
-        match = re.search(r'@aget-version:\s*([\d.]+)|Version:\s*([\d.]+)', content)
+        match = VERSION_EXTRACT_RE.search(content)
         if match:
             result['version'] = match.group(1) or match.group(2)
     else:
@@ -117,21 +327,24 @@ def validate_file(file_path: Path) -> Dict[str, Any]:
         result['warnings'].append("Missing version tag (@aget-version: X.Y.Z)")
 
     # R-CLI-002: North Star reference
-    if re.search(PATTERNS['north_star'], content, re.IGNORECASE):
+    if _RE_NORTH_STAR.search(content):
         result['checks']['north_star'] = True
     else:
         result['checks']['north_star'] = False
         result['warnings'].append("Missing North Star/Purpose section")
 
     # R-CLI-004: Session protocol
-    if re.search(PATTERNS['session_protocol'], content, re.IGNORECASE):
+    if _RE_SESSION.search(content):
         result['checks']['session_protocol'] = True
     else:
         result['checks']['session_protocol'] = False
         result['warnings'].append("Missing session protocol (wake up/wind down)")
 
     # V-CLI-004: No hardcoded paths
-    hardcoded = re.findall(PATTERNS['hardcoded_path'], content)
+    # Substring checks rule out the common clean file without the regex
+    hardcoded = None
+    if any(anchor in content for anchor in HARDCODED_ANCHORS):
+        hardcoded = _RE_HARDCODED_PATH.findall(content)
     if hardcoded:
         result['checks']['no_hardcoded_paths'] = False
         result['warnings'].append(f"Hardcoded paths found: {len(hardcoded)}")
@@ -139,20 +352,14 @@ def validate_file(file_path: Path) -> Dict[str, Any]:
         result['checks']['no_hardcoded_paths'] = True
 
     # V-CLI-005: References .aget/
-    if re.search(PATTERNS['aget_reference'], content):
+    if _RE_AGET_REFERENCE.search(content):
         result['checks']['aget_reference'] = True
     else:
         result['checks']['aget_reference'] = False
         result['warnings'].append("No reference to .aget/ directory")
 
-    # Security: No secrets
-    secrets = re.findall(PATTERNS['secrets'], content)
-    if secrets:
-        result['checks']['no_secrets'] = False
-        result['errors'].append("Potential secrets found in file")
-        result['passed'] = False
-    else:
-        result['checks']['no_secrets'] = True
+    # Security: No secrets (checked above)
+    result['checks']['no_secrets'] = True
 
     # File size check
     size_kb = len(content) / 1024
@@ -170,36 +377,91 @@ def validate_file(file_path: Path) -> Dict[str, Any]:
     return result
 
 
-def validate_identity_sync(agent_path: Path, cli_content: str) -> Tuple[bool, str]:
+def load_north_star(agent_path: Path) -> Tuple[Optional[str], str]:
     """
-    Check if CLI north star matches identity.json.
+    Read the north star prefix used for the identity sync check.
 
-    Returns (synced, message).
+    Returns (prefix, message): prefix is the first 50 chars of the
+    identity.json north star, or None when there is nothing to compare
+    (message says why).
     """
     identity_path = agent_path / '.aget' / 'identity.json'
     if not identity_path.exists():
-        return True, "No identity.json to compare"
+        return None, "No identity.json to compare"
 
     try:
-        with open(identity_path) as f:
-            identity = json.load(f)
+        identity = _loads(identity_path.read_bytes())
     except (json.JSONDecodeError, IOError):
-        return True, "Could not read identity.json"
+        return None, "Could not read identity.json"
 
     north_star = identity.get('north_star', '')
     if isinstance(north_star, dict):
         north_star = north_star.get('statement', '')
 
     if not north_star:
-        return True, "No north_star in identity.json"
+        return None, "No north_star in identity.json"
+
+    return north_star[:50], ""  # Check first 50 chars
+
+
+def validate_identity_sync(
+    agent_path: Path,
+    cli_content: str,
+    north_star: Optional[Tuple[Optional[str], str]] = None,
+) -> Tuple[bool, str]:
+    """
+    Check if CLI north star matches identity.json.
+
+    north_star is a load_north_star() result to reuse across files;
+    identity.json is read when it is omitted.
+
+    Returns (synced, message).
+    """
+    prefix, message = north_star if north_star is not None else load_north_star(agent_path)
+    if prefix is None:
+        return True, message
 
     # Check if north star text appears in CLI file
-    if north_star[:50] in cli_content:  # Check first 50 chars
+    if prefix in cli_content:
         return True, "North star synced"
     else:
         return False, "North star may be out of sync with identity.json"
 
 
+def _validate_cli_file(
+    agent_path: Path,
+    cli_name: str,
+    entry: os.DirEntry,
+    north_star: Tuple[Optional[str], str],
+) -> Dict[str, Any]:
+    """Validate one CLI settings file, including the identity sync check."""
+    file_path = agent_path / entry.name
+
+    # Read once; the text is shared by validate_file and the identity
+    # check. The size comes from the stat cached on the entry by
+    # _find_cli_entries. Oversized or unreadable files are left to
+    # validate_file, which reports them.
+    try:
+        if entry.stat().st_size > MAX_FILE_BYTES:
+            content = None
+        else:
+            content = file_path.read_text()
+    except IOError:
+        content = None
+
+    file_result = validate_file(file_path, content)
+    file_result['cli_type'] = cli_name
+
+    # Check identity sync
+    if content is not None:
+        synced, sync_msg = validate_identity_sync(agent_path, content, north_star)
+        file_result['identity_sync'] = synced
+        if not synced:
+            file_result['warnings'].append(sync_msg)
+
+    return file_result
+
+
 def validate_agent(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
     """
     Validate all CLI settings for an agent.
@@ -222,7 +484,7 @@ def validate_agent(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
         return result
 
     # Find CLI files
-    cli_files = find_cli_files(agent_path)
+    cli_files = _find_cli_entries(agent_path)
     result['files_found'] = len(cli_files)
 
     if not cli_files:
@@ -233,34 +495,32 @@ def validate_agent(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
     if verbose:
         log_diagnostic(f"Found {len(cli_files)} CLI settings file(s)")
 
-    # Validate each file
-    for cli_name, file_path in cli_files.items():
-        if verbose:
-            log_diagnostic(f"Validating {file_path.name}...")
-
-        file_result = validate_file(file_path)
-        file_result['cli_type'] = cli_name
-
-        # Check identity sync
-        try:
-            content = file_path.read_text()
-            synced, sync_msg = validate_identity_sync(agent_path, content)
-            file_result['identity_sync'] = synced
-            if not synced:
-                file_result['warnings'].append(sync_msg)
-        except IOError:
-            pass
-
-        result['files'].append(file_result)
+    # identity.json is per agent; parse it once for all files
+    north_star = load_north_star(agent_path)
 
-        if file_result['passed']:
-            result['files_passed'] += 1
-        if file_result['warnings']:
-            result['files_warned'] += 1
-
-    # Determine overall status
-    errors = sum(1 for f in result['files'] if not f['passed'])
-    warnings = sum(1 for f in result['files'] if f['warnings'])
+    # Validate files concurrently (read + regex scans); map() keeps the
+    # CLI_FILES order in the report
+    if verbose:
+        for entry in cli_files.values():
+            log_diagnostic(f"Validating {entry.name}...")
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MAX_FILE_WORKERS, len(cli_files))
+    ) as executor:
+        file_results = executor.map(
+            lambda item: _validate_cli_file(agent_path, item[0], item[1], north_star),
+            cli_files.items(),
+        )
+        for file_result in file_results:
+            result['files'].append(file_result)
+
+            if file_result['passed']:
+                result['files_passed'] += 1
+            if file_result['warnings']:
+                result['files_warned'] += 1
+
+    # Determine overall status from the counters (one result per file found)
+    errors = result['files_found'] - result['files_passed']
+    warnings = result['files_warned']
 
     if errors > 0:
         result['overall_status'] = 'error'
@@ -274,9 +534,10 @@ def validate_agent(agent_path: Path, verbose: bool = False) -> Dict[str, Any]:
 
 def format_human_output(result: Dict[str, Any]) -> str:
     """Format result for human-readable output."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append("\n=== CLI Settings Validation ===\n")
+    w("\n=== CLI Settings Validation ===\n\n")
 
     status = result.get('overall_status', 'unknown')
     status_symbol = {
@@ -285,9 +546,9 @@ def format_human_output(result: Dict[str, Any]) -> str:
         'error': 'x'
     }.get(status, '?')
 
-    lines.append(f"Status: [{status_symbol}] {status.upper()}")
-    lines.append(f"Files: {result.get('files_found', 0)} found, {result.get('files_passed', 0)} passed")
-    lines.append("")
+    w(f"Status: [{status_symbol}] {status.upper()}\n"
+      f"Files: {result.get('files_found', 0)} found, {result.get('files_passed', 0)} passed\n"
+      "\n")
 
     for file_result in result.get('files', []):
         symbol = '+' if file_result['passed'] else 'x'
@@ -295,23 +556,22 @@ def format_human_output(result: Dict[str, Any]) -> str:
         cli_type = file_result.get('cli_type', 'unknown')
         version = file_result.get('version', 'unknown')
 
-        lines.append(f"  [{symbol}] {name} ({cli_type}) - v{version}")
+        w(f"  [{symbol}] {name} ({cli_type}) - v{version}\n")
 
         # Checks
         for check, passed in file_result.get('checks', {}).items():
             check_symbol = '+' if passed else '!'
-            lines.append(f"      [{check_symbol}] {check.replace('_', ' ')}")
+            w(f"      [{check_symbol}] {check.replace('_', ' ')}\n")
 
         # Errors
         for error in file_result.get('errors', []):
-            lines.append(f"      [x] {error}")
+            w(f"      [x] {error}\n")
 
         # Warnings
         for warning in file_result.get('warnings', []):
-            lines.append(f"      [!] {warning}")
+            w(f"      [!] {warning}\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -381,7 +641,7 @@ Exit codes:
     result = validate_agent(agent_path, args.verbose)
 
     if args.json:
-        print(json.dumps(result, indent=2 if args.pretty else None))
+        print(_dumps(result, pretty=args.pretty))
     else:
         print(format_human_output(result))
 
@@ -13,6 +13,7 @@ Usage:
     python3 validate_fleet.py --json             # JSON output
     python3 validate_fleet.py --dry-run          # Preview without checks
     python3 validate_fleet.py --dir /path/repos  # Specify repos directory
+    python3 validate_fleet.py --cache            # Reuse results for unchanged repos
 
 Exit codes:
     0: All validations passed
@@ -33,15 +34,31 @@ Version: 1.0.0 (v3.1.0)
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import io
 import json
 import os
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # =============================================================================
 # L039: Diagnostic Efficiency - Timing
@@ -56,6 +73,22 @@ def log_diagnostic(msg: str) -> None:
     print(f"[{elapsed:.0f}ms] {msg}", file=sys.stderr)
 
 
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to JSON text, via orjson if available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -79,6 +112,19 @@ TEMPLATE_REPOS = [
 
 CORE_REPO = 'aget'
 
+# Upper bound on repos validated concurrently (git + pytest subprocesses)
+MAX_REPO_WORKERS = 16
+
+# Upper bound on pytest runs at once. Each run is CPU-bound and keeps the
+# 60s timeout, so more runs than cores would make timeouts likely.
+MAX_CONCURRENT_TESTS = os.cpu_count() or 1
+_TEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_TESTS)
+
+# Result cache for --cache, keyed by repo path + fingerprint
+CACHE_FILE = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'aget' / 'validate_fleet.json'
+
 REQUIRED_FILES = [
     '.aget/version.json',
     'manifest.yaml',
@@ -139,8 +185,7 @@ def validate_version(repo_path: Path) -> Tuple[bool, str, List[str]]:
         return False, 'unknown', ['version.json not found']
 
     try:
-        with open(version_file) as f:
-            data = json.load(f)
+        data = _loads(version_file.read_bytes())
     except json.JSONDecodeError as e:
         return False, 'unknown', [f'Invalid JSON: {e}']
 
@@ -156,6 +201,28 @@ def validate_version(repo_path: Path) -> Tuple[bool, str, List[str]]:
     return passed, version, errors
 
 
+def _git_issues_pygit2(repo_path: Path) -> List[str]:
+    """Collect git status issues in-process via libgit2 (no subprocess)."""
+    issues = []
+    repo = pygit2.Repository(str(repo_path))
+
+    # Uncommitted changes: any tracked change or untracked file
+    ignored = getattr(pygit2, 'GIT_STATUS_IGNORED', 1 << 14)
+    if any(flags and not flags & ignored for flags in repo.status().values()):
+        issues.append('Uncommitted changes')
+
+    # Ahead/behind the upstream of the current branch, if it has one
+    if not (repo.head_is_unborn or repo.head_is_detached):
+        branch = repo.branches.local.get(repo.head.shorthand)
+        upstream = branch.upstream if branch is not None else None
+        if upstream is not None:
+            ahead, behind = repo.ahead_behind(branch.target, upstream.target)
+            if ahead or behind:
+                issues.append('Not synced with remote')
+
+    return issues
+
+
 def validate_git_status(repo_path: Path) -> Tuple[bool, List[str]]:
     """
     Validate git repository status.
@@ -167,21 +234,30 @@ def validate_git_status(repo_path: Path) -> Tuple[bool, List[str]]:
     if not (repo_path / '.git').is_dir():
         return False, ['Not a git repository']
 
+    if HAS_PYGIT2:
+        try:
+            issues = _git_issues_pygit2(repo_path)
+            return len(issues) == 0, issues
+        except (pygit2.GitError, KeyError, ValueError):
+            pass  # fall back to the git CLI below
+
     try:
-        # Check for uncommitted changes
+        # One call: -b adds the "## branch...upstream [ahead N]" header
+        # line ahead of the porcelain change lines
         result = subprocess.run(
-            ['git', '-C', str(repo_path), 'status', '--porcelain'],
+            ['git', '-C', str(repo_path), 'status', '--porcelain', '-b'],
             capture_output=True, text=True, timeout=10
         )
-        if result.stdout.strip():
+        lines = result.stdout.splitlines()
+        header = lines[0] if lines and lines[0].startswith('## ') else ''
+        changes = lines[1:] if header else lines
+
+        # Check for uncommitted changes
+        if any(line.strip() for line in changes):
             issues.append('Uncommitted changes')
 
         # Check if ahead/behind
-        result = subprocess.run(
-            ['git', '-C', str(repo_path), 'status', '-sb'],
-            capture_output=True, text=True, timeout=10
-        )
-        if '[ahead' in result.stdout or '[behind' in result.stdout:
+        if '[ahead' in header or '[behind' in header:
             issues.append('Not synced with remote')
 
     except subprocess.TimeoutExpired:
@@ -192,6 +268,15 @@ def validate_git_status(repo_path: Path) -> Tuple[bool, List[str]]:
     return len(issues) == 0, issues
 
 
+def _has_test_files(tests_dir: Path) -> bool:
+    """True if tests_dir holds any file pytest would collect by default."""
+    for _root, _dirs, files in os.walk(tests_dir):
+        for name in files:
+            if name.endswith('.py') and (name.startswith('test_') or name.endswith('_test.py')):
+                return True
+    return False
+
+
 def validate_tests(repo_path: Path) -> Tuple[bool, str]:
     """
     Run tests for repository.
@@ -203,12 +288,19 @@ def validate_tests(repo_path: Path) -> Tuple[bool, str]:
     if not tests_dir.is_dir():
         return True, 'No tests directory'
 
+    # Don't pay for a pytest interpreter start-up when there is nothing
+    # for it to collect
+    if not _has_test_files(tests_dir):
+        return True, 'No test files'
+
     try:
-        result = subprocess.run(
-            ['python3', '-m', 'pytest', str(tests_dir), '-q', '--tb=no'],
-            capture_output=True, text=True, timeout=60,
-            cwd=str(repo_path)
-        )
+        # The timeout covers the run only, not waiting for a slot
+        with _TEST_SLOTS:
+            result = subprocess.run(
+                ['python3', '-m', 'pytest', str(tests_dir), '-q', '--tb=no'],
+                capture_output=True, text=True, timeout=60,
+                cwd=str(repo_path)
+            )
         if result.returncode == 0:
             return True, 'Tests passed'
         else:
@@ -263,6 +355,121 @@ def validate_repo(repo_path: Path, verbose: bool = False) -> Dict[str, Any]:
     return result
 
 
+# =============================================================================
+# Result Cache (--cache)
+# =============================================================================
+
+def _mtime_ns(path: Path) -> int:
+    """st_mtime_ns of path, or 0 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _read_text(path: Path) -> str:
+    """Stripped text of a small file, or '' if unreadable."""
+    try:
+        return path.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return ''
+
+
+def _git_status_z(repo_path: Path) -> Optional[bytes]:
+    """Raw `git status --porcelain -z -b` output, or None if unavailable."""
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(repo_path), 'status', '--porcelain', '-z', '-b',
+             '--untracked-files=all'],
+            capture_output=True, timeout=10
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def repo_fingerprint(repo_path: Path) -> Optional[List[Any]]:
+    """
+    Fingerprint of what validate_repo looks at, or None if the repo
+    can't be fingerprinted (not a git work tree) and must not be cached.
+
+    Covers directory mtimes (files added/removed), version.json, git
+    HEAD/ref, the newest mtime under tests/, and a hash of
+    `git status` output (branch/upstream line, staged, unstaged and
+    untracked changes) together with the mtimes of every path it lists,
+    so a further edit to an already-modified file is also seen.
+    """
+    git_dir = repo_path / '.git'
+    if not git_dir.exists():
+        return None
+    status = _git_status_z(repo_path)
+    if status is None:
+        return None
+
+    head = _read_text(git_dir / 'HEAD')
+    ref = _read_text(git_dir / head[5:]) if head.startswith('ref: ') else ''
+
+    # Entries are "XY path"; a rename/copy entry is followed by the
+    # original path as its own entry
+    changed_mtimes = []
+    entries = status.split(b'\0')
+    i = 1 if entries and entries[0].startswith(b'## ') else 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        paths = [entry[3:]]
+        if entry[:1] in (b'R', b'C') and i < len(entries):
+            paths.append(entries[i])
+            i += 1
+        changed_mtimes.extend(_mtime_ns(repo_path / os.fsdecode(rel)) for rel in paths)
+
+    tests_mtime = 0
+    for root, _dirs, files in os.walk(repo_path / 'tests'):
+        tests_mtime = max([tests_mtime, _mtime_ns(Path(root))]
+                          + [_mtime_ns(Path(root) / name) for name in files])
+
+    return [
+        _mtime_ns(repo_path),
+        _mtime_ns(repo_path / '.aget'),
+        _mtime_ns(repo_path / 'governance'),
+        _mtime_ns(repo_path / '.aget' / 'version.json'),
+        head,
+        ref,
+        _mtime_ns(git_dir / 'packed-refs'),
+        hashlib.sha256(status).hexdigest(),
+        changed_mtimes,
+        tests_mtime,
+    ]
+
+
+def load_cache(cache_file: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the --cache result store, or {} if missing or unreadable."""
+    if cache_file is None:
+        cache_file = CACHE_FILE
+    try:
+        data = _loads(cache_file.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache: Dict[str, Any], cache_file: Optional[Path] = None) -> None:
+    """Write the --cache result store atomically; failures are ignored."""
+    if cache_file is None:
+        cache_file = CACHE_FILE
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        tmp.write_text(_dumps(cache))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
 # =============================================================================
 # Fleet Validation
 # =============================================================================
@@ -285,10 +492,14 @@ def find_repos(base_path: Path) -> List[Path]:
     return repos
 
 
-def validate_fleet(base_path: Path, verbose: bool = False) -> Dict[str, Any]:
+def validate_fleet(base_path: Path, verbose: bool = False,
+                   use_cache: bool = False) -> Dict[str, Any]:
     """
     Validate entire fleet.
 
+    use_cache reuses stored validate_repo results for repos whose
+    fingerprint is unchanged since the last cached run.
+
     Returns fleet validation result.
     """
     fleet_result = {
@@ -322,13 +533,50 @@ def validate_fleet(base_path: Path, verbose: bool = False) -> Dict[str, Any]:
     if verbose:
         log_diagnostic(f"Found {len(repos)} repositories")
 
-    # Validate each repo
-    versions = {}
-    for repo_path in repos:
-        if verbose:
+    # --cache: reuse stored results for repos whose fingerprint matches
+    cache = load_cache() if use_cache else {}
+    cached = {}
+    fingerprints = {}
+    if use_cache:
+        for repo_path in repos:
+            key = str(repo_path)
+            fingerprints[key] = repo_fingerprint(repo_path)
+            if fingerprints[key] is None:
+                continue
+            entry = cache.get(key)
+            if isinstance(entry, dict) and entry.get('fingerprint') == fingerprints[key]:
+                cached[key] = entry['result']
+                if verbose:
+                    log_diagnostic(f"Cache hit: {repo_path.name}")
+    pending = [repo_path for repo_path in repos if str(repo_path) not in cached]
+
+    # Validate repos concurrently; each is dominated by its git and pytest
+    # subprocesses. Results are reported in find_repos order.
+    if verbose:
+        for repo_path in pending:
             log_diagnostic(f"Validating {repo_path.name}...")
+    if pending:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_REPO_WORKERS, len(pending))
+        ) as executor:
+            fresh = dict(zip(
+                map(str, pending),
+                executor.map(lambda repo_path: validate_repo(repo_path, verbose), pending),
+            ))
+    else:
+        fresh = {}
 
-        result = validate_repo(repo_path, verbose)
+    if use_cache and fresh:
+        for key, result in fresh.items():
+            if fingerprints[key] is not None:
+                cache[key] = {'fingerprint': fingerprints[key], 'result': result}
+        save_cache(cache)
+
+    merged = {**cached, **fresh}
+    results = [merged[str(repo_path)] for repo_path in repos]
+
+    versions = {}
+    for repo_path, result in zip(repos, results):
         fleet_result['repos'].append(result)
 
         if result['passed']:
@@ -366,9 +614,10 @@ def validate_fleet(base_path: Path, verbose: bool = False) -> Dict[str, Any]:
 
 def format_human_output(result: Dict[str, Any]) -> str:
     """Format result for human-readable output."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append("\n=== AGET Fleet Validation ===\n")
+    w("\n=== AGET Fleet Validation ===\n\n")
 
     status = result['overall_status']
     status_symbol = {
@@ -377,16 +626,16 @@ def format_human_output(result: Dict[str, Any]) -> str:
         'error': 'x'
     }.get(status, '?')
 
-    lines.append(f"Status: [{status_symbol}] {status.upper()}")
-    lines.append(f"Repos: {result['repos_found']} found, {result['repos_passed']} passed, {result['repos_failed']} failed")
+    w(f"Status: [{status_symbol}] {status.upper()}\n"
+      f"Repos: {result['repos_found']} found, {result['repos_passed']} passed, {result['repos_failed']} failed\n")
 
     if result.get('core_version'):
-        lines.append(f"Core Version: {result['core_version']}")
+        w(f"Core Version: {result['core_version']}\n")
 
     if not result.get('version_consistency', True):
-        lines.append("[!] Version inconsistency detected")
+        w("[!] Version inconsistency detected\n")
 
-    lines.append("")
+    w("\n")
 
     # Individual repos
     for repo in result.get('repos', []):
@@ -394,19 +643,15 @@ def format_human_output(result: Dict[str, Any]) -> str:
         name = repo['name']
         version = repo['version']
 
-        lines.append(f"  [{symbol}] {name} (v{version})")
-
-        if repo['errors']:
-            for error in repo['errors']:
-                lines.append(f"      [x] {error}")
+        w(f"  [{symbol}] {name} (v{version})\n")
 
-        if repo['warnings']:
-            for warning in repo['warnings']:
-                lines.append(f"      [!] {warning}")
+        for error in repo['errors']:
+            w(f"      [x] {error}\n")
 
-    lines.append("")
+        for warning in repo['warnings']:
+            w(f"      [!] {warning}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -451,6 +696,11 @@ Exit codes:
         action='store_true',
         help='List repos without validating'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=f'Reuse results for unchanged repos (stored in {CACHE_FILE})'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -487,14 +737,14 @@ Exit codes:
         return 0
 
     # Run validation
-    result = validate_fleet(base_path, args.verbose)
+    result = validate_fleet(base_path, args.verbose, use_cache=args.cache)
 
     if args.verbose:
         log_diagnostic(f"Validation complete, status={result['overall_status']}")
 
     # Output
     if args.json:
-        print(json.dumps(result, indent=2 if args.pretty else None))
+        print(_dumps(result, pretty=args.pretty))
     else:
         print(format_human_output(result))
 
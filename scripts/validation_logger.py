@@ -36,6 +36,7 @@ Exit Codes:
 import argparse
 import json
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime, timezone
@@ -106,10 +107,16 @@ def append_to_log(agent_root: Path, record: dict) -> Path:
     return log_file
 
 
+# ANSI SGR (color/style) escape sequences
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
 def _strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
-    import re
-    return re.sub(r'\033\[[0-9;]*m', '', text)
+    # Fast path: most output has no escape sequences at all
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
 
 
 def parse_script_output(stdout: str, stderr: str) -> list:
@@ -121,8 +128,10 @@ def parse_script_output(stdout: str, stderr: str) -> list:
     - Text: PASS: name / FAIL: name  (pre_release_validation.py)
     """
     check_details = []
-    for line in stdout.splitlines():
-        clean = _strip_ansi(line).strip()
+    # Strip once for the whole output: escape sequences never span lines,
+    # and ANSI-free output skips the regex entirely
+    for line in _strip_ansi(stdout).splitlines():
+        clean = line.strip()
 
         # Format 1: emoji markers (✅/❌)
         if clean.startswith('✅') or clean.startswith('❌'):
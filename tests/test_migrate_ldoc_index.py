@@ -0,0 +1,43 @@
+"""Tests for scripts/migrate_ldoc_to_v2.py update_index with arbitrary YAML frontmatter."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPT = _ROOT / "scripts" / "migrate_ldoc_to_v2.py"
+_spec = importlib.util.spec_from_file_location("migrate_ldoc_to_v2", _SCRIPT)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+def _write_ldoc(directory: Path, name: str, frontmatter: str) -> None:
+    (directory / name).write_text(f"---\n{frontmatter}---\n\n# Body\n")
+
+
+@pytest.mark.skipif(not _mod.HAS_YAML, reason="PyYAML not installed")
+def test_non_scalar_values_fall_back_to_defaults(tmp_path):
+    _write_ldoc(tmp_path, "L001_list_category.md",
+                "category: [a, b]\ncreated: null\n"
+                "applicability:\n  scope: [x]\n"
+                "enforcement:\n  status: {k: v}\n")
+    index = _mod.update_index(tmp_path)
+    entry = index["ldocs"][0]
+    assert entry["category"] == "observation"
+    assert entry["created"] == ""
+    assert entry["scope"] == "agent"
+    assert entry["enforcement"] == "observation"
+    assert index["categories"] == {"observation": 1}
+
+
+@pytest.mark.skipif(not _mod.HAS_YAML, reason="PyYAML not installed")
+def test_scalar_values_become_text(tmp_path):
+    _write_ldoc(tmp_path, "L002_scalars.md",
+                "category: pattern\ncreated: 2025-01-02\n"
+                "applicability:\n  scope: fleet\n"
+                "enforcement:\n  status: 3\n")
+    entry = _mod.update_index(tmp_path)["ldocs"][0]
+    assert entry["category"] == "pattern"
+    assert entry["created"] == "2025-01-02"
+    assert entry["scope"] == "fleet"
+    assert entry["enforcement"] == "3"
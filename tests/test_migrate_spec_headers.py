@@ -0,0 +1,43 @@
+"""Tests for scripts/migrate_spec_headers.py header rewriting on CRLF specs."""
+import importlib.util
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPT = _ROOT / "scripts" / "migrate_spec_headers.py"
+_spec = importlib.util.spec_from_file_location("migrate_spec_headers", _SCRIPT)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+def _crlf_spec(body_lines: int) -> bytes:
+    header = "# AGET Test Specification\r\n\r\n**Version**: 1.0.0\r\n\r\n---\r\n"
+    body = "".join(f"Body line {i} with some text\r\n" for i in range(body_lines))
+    return (header + body).encode("utf-8")
+
+
+def _expected_body(body_lines: int) -> str:
+    return "".join(f"Body line {i} with some text\n" for i in range(body_lines))
+
+
+def test_crlf_spec_below_probe_size(tmp_path):
+    path = tmp_path / "AGET_TEST_SPEC.md"
+    path.write_bytes(_crlf_spec(10))
+    assert path.stat().st_size < _mod.SPEC_PROBE_BYTES
+
+    changed, message = _mod.migrate_spec(path, dry_run=False)
+    assert changed, message
+    text = path.read_bytes().decode("utf-8")
+    assert "\r" not in text
+    assert text.endswith("\n---\n" + _expected_body(10))
+
+
+def test_crlf_spec_above_probe_size(tmp_path):
+    path = tmp_path / "AGET_TEST_SPEC.md"
+    path.write_bytes(_crlf_spec(400))
+    assert path.stat().st_size > _mod.SPEC_PROBE_BYTES
+
+    changed, message = _mod.migrate_spec(path, dry_run=False)
+    assert changed, message
+    text = path.read_bytes().decode("utf-8")
+    assert "\r" not in text
+    assert text.endswith("\n---\n" + _expected_body(400))
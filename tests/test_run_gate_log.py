@@ -0,0 +1,106 @@
+"""Tests for scripts/run_gate.py gate log rotation, lookup and agent root override (CAP-REL-022)."""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPT = _ROOT / "scripts" / "run_gate.py"
+_spec = importlib.util.spec_from_file_location("run_gate", _SCRIPT)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+@pytest.fixture
+def agent_root(tmp_path):
+    (tmp_path / ".aget").mkdir()
+    yield tmp_path
+    # Release cached append descriptors for this agent's log
+    for path in [p for p in _mod._LOG_FDS if str(p).startswith(str(tmp_path))]:
+        os.close(_mod._LOG_FDS.pop(path))
+
+
+def _record(gate_id, version, status="pass"):
+    return _mod.create_gate_record(
+        gate_id=gate_id, aget_version=version, status=status,
+        validation_summary="V-1 PASS", operator="test",
+    )
+
+
+def test_rotate_below_threshold_is_noop(agent_root):
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0"))
+    assert _mod.rotate_gate_log(agent_root, max_bytes=1 << 20) is None
+    assert _mod._rotated_gate_logs(_mod.get_gate_log_path(agent_root).parent) == []
+
+
+def test_rotate_over_threshold_starts_fresh_log(agent_root):
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0"))
+    rotated = _mod.rotate_gate_log(agent_root, max_bytes=1)
+    assert rotated is not None and rotated.exists()
+    assert rotated.name.startswith("gate_log.") and rotated.name != "gate_log.jsonl"
+
+    # The next append goes to a new gate_log.jsonl, not the rotated file
+    _mod.append_gate_record(agent_root, _record("G1", "3.6.0"))
+    log_file = _mod.get_gate_log_path(agent_root)
+    assert [json.loads(l)["gate_id"] for l in log_file.read_text().splitlines()] == ["G1"]
+    assert [json.loads(l)["gate_id"] for l in rotated.read_text().splitlines()] == ["G0"]
+
+
+def test_prior_gate_found_only_in_rotated_log(agent_root):
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0"))
+    _mod.rotate_gate_log(agent_root, max_bytes=1)
+    _mod.append_gate_record(agent_root, _record("G1", "3.6.0"))
+
+    allowed, reason = _mod.check_prior_gate(agent_root, "G0", "3.6.0")
+    assert allowed, reason
+    allowed, reason = _mod.check_prior_gate(agent_root, "G0", "3.7.0")
+    assert not allowed and "BLOCKED" in reason
+
+
+def test_latest_record_prefers_newest_log(agent_root):
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0", status="pass"))
+    _mod.rotate_gate_log(agent_root, max_bytes=1)
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0", status="fail"))
+
+    assert _mod.find_latest_gate_record(agent_root, "G0", "3.6.0")["status"] == "fail"
+    allowed, _ = _mod.check_prior_gate(agent_root, "G0", "3.6.0")
+    assert not allowed
+
+
+def test_read_gate_log_version_filter_and_rotated(agent_root):
+    _mod.append_gate_record(agent_root, _record("G0", "3.6.0"))
+    _mod.append_gate_record(agent_root, _record("G0", "3.5.0"))
+    _mod.rotate_gate_log(agent_root, max_bytes=1)
+    _mod.append_gate_record(agent_root, _record("G1", "3.6.0"))
+
+    current = _mod.read_gate_log(agent_root, version="3.6.0")
+    assert [r["gate_id"] for r in current] == ["G1"]
+
+    everything = _mod.read_gate_log(agent_root, include_rotated=True, version="3.6.0")
+    assert [r["gate_id"] for r in everything] == ["G0", "G1"]
+    assert all(r["aget_version"] == "3.6.0" for r in everything)
+
+
+def test_agent_root_env_override(tmp_path):
+    agent = tmp_path / "agent"
+    (agent / ".aget").mkdir(parents=True)
+    env = dict(os.environ, AGET_AGENT_ROOT=str(agent))
+    r = subprocess.run(
+        [sys.executable, str(_SCRIPT), "--gate", "G0", "--version", "3.6.0",
+         "--status", "pass", "--summary", "V-1 PASS"],
+        capture_output=True, text=True, env=env, cwd=str(tmp_path),
+    )
+    assert r.returncode == 0, r.stdout + r.stderr
+    log_file = agent / ".aget" / "logs" / "gate_log.jsonl"
+    assert [json.loads(l)["gate_id"] for l in log_file.read_text().splitlines()] == ["G0"]
+
+    r = subprocess.run(
+        [sys.executable, str(_SCRIPT), "--check", "G1", "--version", "3.6.0",
+         "--prior-gate", "G0"],
+        capture_output=True, text=True, env=env, cwd=str(tmp_path),
+    )
+    assert r.returncode == 0, r.stdout + r.stderr
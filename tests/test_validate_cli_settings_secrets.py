@@ -0,0 +1,67 @@
+"""Tests for the optional hyperscan secrets scan in scripts/validate_cli_settings.py."""
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPT = _ROOT / "scripts" / "validate_cli_settings.py"
+_spec = importlib.util.spec_from_file_location("validate_cli_settings", _SCRIPT)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+pytestmark = pytest.mark.skipif(_mod._SECRETS_DB is None, reason="hyperscan not installed")
+
+_TOKENS = ["API_KEY", "API_KE", "SECRET", "secret", "PASSWORD", "TOKEN", "=", " = ",
+           '"', "'", "abc", "\n", "\t", " ", "x", "é", "TOKEN=", "TOKEN = 'v'",
+           "\xa0", "\u2003", "\x1c", "\u180e", "\u200b"]
+
+
+def _regex_hit(content):
+    return _mod.COMPILED_PATTERNS["secrets"].search(content) is not None
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "no credentials here",
+    "API_KEY",
+    "my SECRET value",
+    "PASSWORD: hunter2",
+    'TOKEN = "abc"',
+    "TOKEN='x'",
+    "TOKEN = ''",
+    "token = 'lowercase is not matched'",
+    "prefix\nTOKEN\t=\t'v'\nsuffix",
+    "café SECRET",
+    'TOKEN\xa0=\xa0"abc"',
+    'TOKEN\u2003=\u2003"abc"',
+    'TOKEN\x1c=\x1f"abc"',
+    'TOKEN\u3000= "é"',
+    'TOKEN\u180e="abc"',
+])
+def test_database_agrees_with_regex(content):
+    assert _mod.has_secrets(content) == _regex_hit(content)
+
+
+def test_database_agrees_with_regex_fuzz():
+    rng = random.Random(0)
+    for _ in range(2000):
+        content = "".join(rng.choice(_TOKENS) for _ in range(rng.randint(0, 10)))
+        assert _mod.has_secrets(content) == _regex_hit(content), repr(content)
+
+
+def test_scan_stops_at_first_hit(monkeypatch):
+    calls = []
+
+    class CountingDb:
+        def scan(self, data, match_event_handler):
+            def handler(*match):
+                calls.append(match)
+                return match_event_handler(*match)
+            return real_db.scan(data, match_event_handler=handler)
+
+    real_db = _mod._SECRETS_DB
+    monkeypatch.setattr(_mod, "_SECRETS_DB", CountingDb())
+    assert _mod.has_secrets("SECRET " * 1000)
+    assert len(calls) == 1
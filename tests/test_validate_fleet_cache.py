@@ -0,0 +1,120 @@
+"""Tests for the validate_fleet.py --cache result store and repo fingerprint."""
+import importlib.util
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCRIPT = _ROOT / "scripts" / "validate_fleet.py"
+_spec = importlib.util.spec_from_file_location("validate_fleet", _SCRIPT)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True, capture_output=True,
+    )
+
+
+def _make_repo(path: Path) -> Path:
+    (path / ".aget").mkdir(parents=True)
+    (path / ".aget" / "version.json").write_text('{"aget_version": "3.1.0"}')
+    (path / "manifest.yaml").write_text("name: x\n")
+    (path / "src.py").write_text("X = 1\n")
+    _git(path, "init", "-q")
+    _git(path, "add", "-A")
+    _git(path, "commit", "-q", "-m", "init")
+    return path
+
+
+def _touch_later(path: Path):
+    """Bump mtime so the change is visible even on coarse-mtime filesystems."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_fingerprint_stable_when_unchanged(tmp_path):
+    repo = _make_repo(tmp_path / "aget")
+    assert _mod.repo_fingerprint(repo) == _mod.repo_fingerprint(repo)
+
+
+def test_fingerprint_changes_on_tracked_edit_outside_tests(tmp_path):
+    repo = _make_repo(tmp_path / "aget")
+    before = _mod.repo_fingerprint(repo)
+    (repo / "manifest.yaml").write_text("name: y\n")
+    assert _mod.repo_fingerprint(repo) != before
+
+
+def test_fingerprint_changes_on_second_edit_of_dirty_file(tmp_path):
+    repo = _make_repo(tmp_path / "aget")
+    (repo / "src.py").write_text("X = 2\n")
+    before = _mod.repo_fingerprint(repo)
+    (repo / "src.py").write_text("X = 3\n")
+    _touch_later(repo / "src.py")
+    assert _mod.repo_fingerprint(repo) != before
+
+
+def test_fingerprint_none_outside_git(tmp_path):
+    (tmp_path / "plain").mkdir()
+    assert _mod.repo_fingerprint(tmp_path / "plain") is None
+
+
+def test_load_save_round_trip(tmp_path):
+    cache_file = tmp_path / "c" / "cache.json"
+    _mod.save_cache({"k": {"fingerprint": [1], "result": {"passed": True}}}, cache_file)
+    assert _mod.load_cache(cache_file) == {"k": {"fingerprint": [1], "result": {"passed": True}}}
+
+
+def test_load_missing_or_corrupt_is_empty(tmp_path):
+    assert _mod.load_cache(tmp_path / "missing.json") == {}
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert _mod.load_cache(bad) == {}
+    bad.write_text("[1, 2]")
+    assert _mod.load_cache(bad) == {}
+
+
+@pytest.fixture
+def fleet(tmp_path, monkeypatch):
+    """A one-repo fleet with a counting validate_repo and a private cache file."""
+    repo = _make_repo(tmp_path / "repos" / "aget")
+    monkeypatch.setattr(_mod, "CACHE_FILE", tmp_path / "cache.json")
+    calls = []
+
+    def fake_validate_repo(repo_path, verbose=False):
+        calls.append(repo_path.name)
+        return {"name": repo_path.name, "path": str(repo_path), "passed": True,
+                "version": "3.1.0", "errors": [], "warnings": [], "checks": {}}
+
+    monkeypatch.setattr(_mod, "validate_repo", fake_validate_repo)
+    return repo, calls
+
+
+def test_validate_fleet_cache_hit(fleet):
+    repo, calls = fleet
+    _mod.validate_fleet(repo.parent, use_cache=True)
+    result = _mod.validate_fleet(repo.parent, use_cache=True)
+    assert calls == ["aget"]
+    assert result["repos_passed"] == 1
+
+
+def test_validate_fleet_cache_miss_without_flag(fleet):
+    repo, calls = fleet
+    _mod.validate_fleet(repo.parent, use_cache=True)
+    _mod.validate_fleet(repo.parent)
+    assert calls == ["aget", "aget"]
+
+
+def test_validate_fleet_cache_invalidated_by_edit(fleet):
+    repo, calls = fleet
+    _mod.validate_fleet(repo.parent, use_cache=True)
+    (repo / "src.py").write_text("X = 2\n")
+    _mod.validate_fleet(repo.parent, use_cache=True)
+    assert calls == ["aget", "aget"]